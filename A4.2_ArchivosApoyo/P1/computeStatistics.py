@@ -2,39 +2,161 @@
 """
 Programa: computeStatistics.py
 Descripción: Calcula estadísticas descriptivas de múltiples archivos de texto.
+Entradas: archivos, comprimidos (.gz, .bz2, .xz), directorios, patrones
+glob o '-' para stdin (ver text_input.py).
+Opciones: --extra agrega métricas (MIN, MAX, P50, P90, P99, P999,
+HISTOGRAM o ALL) calculadas con el mismo ordenamiento de la mediana;
+--stream resume cada archivo en una sola pasada con memoria acotada
+(percentiles aproximados, sin moda) y agrega la columna TOTAL.
 Salida: Archivo .txt con formato tabular.
 """
+import argparse
+import bisect
+import os
 import sys
 import time
+from collections import namedtuple
 
+from quantile_sketch import StreamingStats
 
-def read_file(filename):
+# La capa de entrada compartida (text_input.py) está en el directorio padre
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from text_input import (  # noqa: E402 pylint: disable=C0413,C0411
+    expand_inputs, read_lines, result_name)
+
+USAGE = ("python computeStatistics.py [--extra P50,P99,...|ALL] [--bins N] "
+         "[--stream [--sketch-k K]] TC1.txt TC2.txt.gz datos/ 'TC*.txt' - ...")
+
+# Métricas de siempre y métricas adicionales que se pueden pedir
+BASE_METRICS = ["COUNT", "MEAN", "MEDIAN", "MODE", "SD", "VARIANCE"]
+PERCENTILES = {"P50": 50, "P90": 90, "P99": 99, "P999": 99.9}
+EXTRA_METRICS = ["MIN", "MAX", *PERCENTILES, "HISTOGRAM"]
+
+# Intervalos de igual ancho del histograma, entre el mínimo y el máximo
+HISTOGRAM_BINS = 10
+
+# Parámetro k del sketch de cuantiles del modo --stream
+SKETCH_K = 200
+
+# Lo que necesitan las métricas adicionales, exacto o aproximado:
+# quantile(pct) da el percentil y rank(x) cuántos valores son menores
+Summary = namedtuple("Summary", "count lowest highest quantile rank")
+
+
+def read_numbers(filename, add):
     """
-    Lee un archivo y retorna una lista de números.
+    Lee un archivo y pasa cada número a `add`.
     Maneja datos inválidos e imprime errores en consola de error (stderr).
+    Retorna False si el archivo no se pudo leer.
     """
-    data = []
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                clean_line = line.strip()
-                if not clean_line:
-                    continue
-                try:
-                    number = float(clean_line)
-                    data.append(number)
-                except ValueError:
-                    # Reportar error sin detener ejecución
-                    sys.stderr.write(f"Error en {filename}, línea {line_num}: "
-                                     f"'{clean_line}' no es numérico.\n")
+        for line_num, line in enumerate(read_lines(filename), 1):
+            clean_line = line.strip()
+            if not clean_line:
+                continue
+            try:
+                number = float(clean_line)
+            except ValueError:
+                # Reportar error sin detener ejecución
+                sys.stderr.write(f"Error en {filename}, línea {line_num}: "
+                                 f"'{clean_line}' no es numérico.\n")
+                continue
+            add(number)
     except FileNotFoundError:
         sys.stderr.write(f"Error: El archivo '{filename}' no fue encontrado.\n")
-        return None
-    return data
+        return False
+    except OSError as error:
+        sys.stderr.write(f"Error leyendo '{filename}': {error}\n")
+        return False
+    return True
+
+
+def read_file(filename):
+    """Lee un archivo y retorna una lista de números (None si falla)."""
+    data = []
+    return data if read_numbers(filename, data.append) else None
+
+
+def stream_file(filename, sketch_k=SKETCH_K):
+    """Resume un archivo en un StreamingStats sin guardar los números."""
+    summary = StreamingStats(sketch_k)
+    return summary if read_numbers(filename, summary.update) else None
+
+
+def metric_names(extra=(), bins=HISTOGRAM_BINS):
+    """Filas del reporte: las métricas base más las adicionales pedidas."""
+    names = list(BASE_METRICS)
+    for metric in extra:
+        if metric == "HISTOGRAM":
+            names.extend(f"HIST{i}" for i in range(1, bins + 1))
+        else:
+            names.append(metric)
+    return names
+
+
+def percentile(sorted_data, pct):
+    """Percentil con interpolación lineal (como PERCENTILE.INC de Excel)."""
+    position = (len(sorted_data) - 1) * pct / 100
+    low = int(position)
+    high = min(low + 1, len(sorted_data) - 1)
+    return sorted_data[low] + \
+        (sorted_data[high] - sorted_data[low]) * (position - low)
+
+
+def histogram(rank, count, lowest, highest, bins=HISTOGRAM_BINS):
+    """
+    Histograma de `bins` intervalos de igual ancho entre lowest y highest.
+    `rank(x)` indica cuántos valores son menores que x. Retorna tuplas
+    (desde, hasta, cantidad); el último intervalo incluye al máximo.
+    """
+    width = (highest - lowest) / bins
+    edges = [lowest + width * i for i in range(bins)] + [highest]
+    below = [rank(edge) for edge in edges[:-1]] + [count]
+    return [(edges[i], edges[i + 1], below[i + 1] - below[i])
+            for i in range(bins)]
+
+
+def extra_metrics(extra, bins, summary):
+    """
+    Calcula las métricas adicionales pedidas a partir de un Summary,
+    que puede ser exacto (datos ordenados) o aproximado (sketch).
+    """
+    stats = {}
+    for metric in extra:
+        if metric == "MIN":
+            stats[metric] = summary.lowest
+        elif metric == "MAX":
+            stats[metric] = summary.highest
+        elif metric == "HISTOGRAM":
+            for i, interval in enumerate(
+                    histogram(summary.rank, summary.count, summary.lowest,
+                              summary.highest, bins), 1):
+                stats[f"HIST{i}"] = interval
+        else:
+            stats[metric] = summary.quantile(PERCENTILES[metric])
+    return stats
+
+
+def find_mode(data):
+    """Valor más frecuente, o "#N/A" si ninguno se repite."""
+    frequency = {}
+    for item in data:
+        frequency[item] = frequency.get(item, 0) + 1
+
+    max_freq = max(frequency.values())
+    # Si todos los números aparecen 1 sola vez, no hay moda útil (ej. floats)
+    if max_freq == 1:
+        return "#N/A"
+    modes = [k for k, v in frequency.items() if v == max_freq]
+    return modes[0]  # Tomamos el primero si hay múltiples
 
 
-def calculate_stats(data):
-    """Calcula métricas: Count, Mean, Median, Mode, SD, Variance."""
+def calculate_stats(data, extra=(), bins=HISTOGRAM_BINS):
+    """
+    Calcula métricas: Count, Mean, Median, Mode, SD, Variance y las
+    adicionales de `extra` (ver EXTRA_METRICS), que reutilizan los
+    datos ya ordenados para la mediana.
+    """
     if not data:
         return None
 
@@ -50,17 +172,7 @@ def calculate_stats(data):
         median = (sorted_data[mid - 1] + sorted_data[mid]) / 2.0
 
     # Moda
-    frequency = {}
-    for item in data:
-        frequency[item] = frequency.get(item, 0) + 1
-
-    max_freq = max(frequency.values())
-    # Si todos los números aparecen 1 sola vez, no hay moda útil (ej. floats)
-    if max_freq == 1:
-        mode = "#N/A"
-    else:
-        modes = [k for k, v in frequency.items() if v == max_freq]
-        mode = modes[0]  # Tomamos el primero si hay múltiples
+    mode = find_mode(data)
 
     # Varianza y Desviación Estándar
     if count < 2:
@@ -70,40 +182,80 @@ def calculate_stats(data):
 
     std_dev = variance ** 0.5
 
-    return {
+    stats = {
         "COUNT": count, "MEAN": mean, "MEDIAN": median,
         "MODE": mode, "SD": std_dev, "VARIANCE": variance
     }
+    stats.update(extra_metrics(extra, bins, Summary(
+        count, sorted_data[0], sorted_data[-1],
+        lambda pct: percentile(sorted_data, pct),
+        lambda value: bisect.bisect_left(sorted_data, value))))
+    return stats
+
+
+def summarize_stream(summary, extra=(), bins=HISTOGRAM_BINS):
+    """
+    Métricas de un StreamingStats con las mismas llaves que
+    calculate_stats. La mediana y los percentiles son aproximados y la
+    moda no está disponible.
+    """
+    if not summary.count:
+        return None
+    sketch = summary.sketch
+    stats = {
+        "COUNT": summary.count, "MEAN": summary.mean,
+        "MEDIAN": sketch.quantile(0.5), "MODE": "#N/A",
+        "SD": summary.variance ** 0.5, "VARIANCE": summary.variance
+    }
+    stats.update(extra_metrics(extra, bins, Summary(
+        summary.count, summary.minimum, summary.maximum,
+        lambda pct: sketch.quantile(pct / 100), sketch.rank)))
+    return stats
 
 
-def print_results(results, filenames, elapsed_time):
+def format_value(metric, val, last_bin=None):
+    """
+    Texto de una celda del reporte. Los intervalos del histograma se
+    muestran como "cantidad [desde, hasta)", salvo `last_bin`, el
+    último, que incluye al máximo y se cierra con "]".
+    """
+    # Formateo de salida similar al ejemplo
+    if val == "#N/A":
+        return val
+    if metric == "COUNT":
+        return f"{int(val)}"
+    if metric == "MODE":
+        return f"{val}"
+    if isinstance(val, tuple):
+        low, high, amount = val
+        closing = "]" if metric == last_bin else ")"
+        return f"{amount} [{low:.2f}, {high:.2f}{closing}"
+    # Flotantes con 2 decimales o formato general si es muy grande
+    return f"{val:.2f}"
+
+
+def print_results(results, filenames, elapsed_time, metrics=None):
     """
     Imprime los resultados en formato tabular (matriz transpuesta)
-    y los guarda en StatisticsResults.txt.
+    y los guarda en StatisticsResults.txt. `metrics` son las filas a
+    mostrar (por omisión, BASE_METRICS; ver metric_names).
     """
-    metrics = ["COUNT", "MEAN", "MEDIAN", "MODE", "SD", "VARIANCE"]
+    metrics = metrics or BASE_METRICS
+    bins = [metric for metric in metrics if metric.startswith("HIST")]
+    last_bin = bins[-1] if bins else None
 
     # Construcción de encabezados
     # Usamos tabuladores \t para alinear columnas
-    header = "TC\t" + "\t".join([name.replace(".txt", "") for name in filenames])
+    header = "TC\t" + "\t".join(
+        result_name(name).replace(".txt", "") for name in filenames)
 
     rows = [header]
 
     for metric in metrics:
         row_parts = [metric]
         for name in filenames:
-            val = results[name][metric]
-
-            # Formateo de salida similar al ejemplo
-            if val == "#N/A":
-                row_parts.append(val)
-            elif metric == "COUNT":
-                row_parts.append(f"{int(val)}")
-            elif metric == "MODE":
-                row_parts.append(f"{val}")
-            else:
-                # Flotantes con 2 decimales o formato general si es muy grande
-                row_parts.append(f"{val:.2f}")
+            row_parts.append(
+                format_value(metric, results[name][metric], last_bin))
 
         rows.append("\t".join(row_parts))
 
@@ -122,33 +274,92 @@ def print_results(results, filenames, elapsed_time):
     print(f"\nArchivo generado exitosamente: {output_filename}")
 
 
+def parse_extra(text):
+    """Convierte 'P50,P99,HISTOGRAM' (o 'ALL') en la lista de métricas."""
+    if text.strip().upper() == "ALL":
+        return list(EXTRA_METRICS)
+    names = [name.strip().upper() for name in text.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXTRA_METRICS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"métricas desconocidas: {', '.join(unknown)} "
+            f"(opciones: {', '.join(EXTRA_METRICS)}, ALL)")
+    return names
+
+
+def process_file(filename, args, total):
+    """
+    Métricas de un archivo según las opciones, o None si no se pudo
+    leer. En modo --stream su resumen también se agrega a `total`.
+    """
+    if args.stream:
+        summary = stream_file(filename, args.sketch_k)
+        if not summary:
+            return None
+        total.merge(summary)
+        return summarize_stream(summary, args.extra, args.bins)
+    data = read_file(filename)
+    if data is None:
+        return None
+    return calculate_stats(data, args.extra, args.bins)
+
+
+def at_least(minimum):
+    """Tipo para argparse: entero mayor o igual a `minimum`."""
+    def parse(text):
+        try:
+            value = int(text)
+        except ValueError:
+            value = None
+        if value is None or value < minimum:
+            raise argparse.ArgumentTypeError(
+                f"se esperaba un entero >= {minimum}: '{text}'")
+        return value
+    return parse
+
+
 def main():
     """Función principal."""
-    if len(sys.argv) < 2:
-        print("Uso: python computeStatistics.py TC1.txt TC2.txt ...")
+    parser = argparse.ArgumentParser(usage=USAGE)
+    parser.add_argument("inputs", nargs="*")
+    parser.add_argument("--extra", type=parse_extra, default=[],
+                        help="métricas adicionales separadas por comas")
+    parser.add_argument("--bins", type=at_least(1), default=HISTOGRAM_BINS,
+                        help="intervalos del histograma")
+    parser.add_argument("--stream", action="store_true",
+                        help="una pasada con memoria acotada")
+    parser.add_argument("--sketch-k", type=at_least(2), default=SKETCH_K,
+                        help="precisión del sketch de cuantiles")
+    args = parser.parse_args()
+    if not args.inputs:
+        print(f"Uso: {USAGE}")
         sys.exit(1)
 
-    filenames = sys.argv[1:]
+    filenames = expand_inputs(args.inputs)
+    metrics = metric_names(args.extra, args.bins)
     start_time = time.time()
 
     all_results = {}
+    total = StreamingStats(args.sketch_k)
 
     # Procesar cada archivo
     for filename in filenames:
-        data = read_file(filename)
-        if data is None:
+        stats = process_file(filename, args, total)
+        if stats is None:
             # Si no se lee, llenamos con ceros para mantener la tabla
-            all_results[filename] = {k: 0 for k in ["COUNT", "MEAN", "MEDIAN",
-                                                    "MODE", "SD", "VARIANCE"]}
-            continue
-
-        stats = calculate_stats(data)
+            stats = {k: 0 for k in metrics}
         all_results[filename] = stats
 
+    # En modo --stream, los resúmenes se combinan en la columna TOTAL
+    if args.stream and len(filenames) > 1:
+        filenames = filenames + ["TOTAL"]
+        all_results["TOTAL"] = summarize_stream(
+            total, args.extra, args.bins) or {k: 0 for k in metrics}
+
     end_time = time.time()
     elapsed = end_time - start_time
 
-    print_results(all_results, filenames, elapsed)
+    print_results(all_results, filenames, elapsed, metrics)
 
 
 if __name__ == "__main__":
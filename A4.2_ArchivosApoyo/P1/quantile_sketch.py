@@ -0,0 +1,162 @@
+"""
+Programa: quantile_sketch.py
+Descripción: Resúmenes de memoria acotada para el modo --stream de
+computeStatistics. QuantileSketch es un sketch de cuantiles tipo KLL y
+StreamingStats agrega conteo, media, varianza, mínimo y máximo en una
+sola pasada. Ambos se pueden combinar (merge), p. ej. para resumir
+varios archivos de un mismo conjunto de datos.
+"""
+import bisect
+import itertools
+import math
+import random
+
+
+class QuantileSketch:
+    """
+    Sketch de cuantiles KLL. Guarda a lo más unos 3*k valores en
+    niveles; un valor del nivel h representa 2**h valores de la entrada.
+    Cuando un nivel se llena se ordena y se conserva uno de cada dos
+    elementos (con desplazamiento aleatorio), que suben al nivel
+    siguiente. El error de rango es del orden de 1.7/k.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.count = 0
+        self.levels = [[]]
+        self._size = 0
+        self._limit = self._max_size()
+        self._rng = random.Random(seed)
+
+    def _capacity(self, level):
+        """Capacidad del nivel: k en el más alto, 2/3 de eso cada nivel."""
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _max_size(self):
+        """Valores que caben en total con la altura actual."""
+        return sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def _compress(self):
+        """Compacta el nivel lleno más bajo hasta que todo quepa."""
+        while self._size >= self._limit:
+            for level, items in enumerate(self.levels):
+                if len(items) >= self._capacity(level):
+                    if level + 1 == len(self.levels):
+                        self.levels.append([])
+                        self._limit = self._max_size()
+                    items.sort()
+                    # Con cantidad impar, el último se queda en su nivel
+                    keep = [items.pop()] if len(items) % 2 else []
+                    promoted = items[self._rng.getrandbits(1)::2]
+                    self.levels[level + 1].extend(promoted)
+                    self.levels[level] = keep
+                    self._size -= len(items) - len(promoted)
+                    break
+
+    def update(self, value):
+        """Agrega un valor."""
+        self.levels[0].append(value)
+        self.count += 1
+        self._size += 1
+        if self._size >= self._limit:
+            self._compress()
+
+    def merge(self, other):
+        """Agrega al sketch todos los valores resumidos en `other`."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        self._limit = self._max_size()
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.count += other.count
+        self._size += sum(len(items) for items in other.levels)
+        self._compress()
+        return self
+
+    def _weighted(self):
+        """Pares (valor, peso) ordenados por valor."""
+        return sorted((value, 1 << level)
+                      for level, items in enumerate(self.levels)
+                      for value in items)
+
+    def rank(self, value):
+        """Número aproximado de valores resumidos menores que `value`."""
+        return sum(len([v for v in items if v < value]) << level
+                   for level, items in enumerate(self.levels))
+
+    def quantiles(self, fractions):
+        """
+        Valores aproximados de los cuantiles (0 a 1) pedidos. Interpola
+        entre las posiciones vecinas como PERCENTILE.INC, de modo que
+        mientras el sketch no compacte el resultado es exacto.
+        """
+        if not self.count:
+            return [None] * len(fractions)
+        weighted = self._weighted()
+        values = [value for value, _ in weighted]
+        # ends[i]: posiciones cubiertas hasta el elemento i, inclusive
+        ends = list(itertools.accumulate(weight for _, weight in weighted))
+
+        def at(position):
+            """Valor que ocupa la posición `position` (desde 0)."""
+            return values[bisect.bisect_right(ends, position)]
+
+        results = []
+        for fraction in fractions:
+            position = fraction * (self.count - 1)
+            low = int(position)
+            high = min(low + 1, self.count - 1)
+            results.append(at(low) + (at(high) - at(low)) * (position - low))
+        return results
+
+    def quantile(self, fraction):
+        """Valor aproximado del cuantil `fraction` (0 a 1)."""
+        return self.quantiles([fraction])[0]
+
+
+class StreamingStats:
+    """
+    Estadísticas de una sola pasada con memoria acotada: conteo, media y
+    varianza (Welford), mínimo, máximo y un QuantileSketch para mediana,
+    percentiles e histograma. La moda no se puede calcular sin guardar
+    todos los valores distintos.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.sketch = QuantileSketch(k, seed)
+
+    def update(self, value):
+        """Agrega un valor."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.sketch.update(value)
+
+    def merge(self, other):
+        """Combina con otro resumen (fórmula de Chan para la varianza)."""
+        count = self.count + other.count
+        if other.count:
+            delta = other.mean - self.mean
+            self.m2 += other.m2 + delta ** 2 * self.count * other.count \
+                / count
+            self.mean += delta * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def variance(self):
+        """Varianza muestral (n - 1), como en calculate_stats."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
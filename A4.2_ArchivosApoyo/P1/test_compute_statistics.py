@@ -0,0 +1,191 @@
+"""
+Pruebas de las métricas de computeStatistics: percentiles, histograma,
+resúmenes de una pasada (QuantileSketch, StreamingStats) y la columna
+TOTAL del modo --stream, comparadas contra resultados exactos.
+"""
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from computeStatistics import (
+    EXTRA_METRICS, calculate_stats, histogram, percentile, summarize_stream
+)
+from quantile_sketch import QuantileSketch, StreamingStats
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      'computeStatistics.py')
+
+
+def exact_percentile(data, pct):
+    """Percentil con statistics (método inclusivo, como PERCENTILE.INC)."""
+    if pct == 99.9:
+        return statistics.quantiles(data, n=1000, method='inclusive')[998]
+    return statistics.quantiles(data, n=100, method='inclusive')[pct - 1]
+
+
+def streamed(data, k=200):
+    """StreamingStats con todos los valores de `data`."""
+    summary = StreamingStats(k, seed=7)
+    for value in data:
+        summary.update(value)
+    return summary
+
+
+class TestExactMetrics(unittest.TestCase):
+    """Métricas calculadas con todos los datos en memoria."""
+
+    def setUp(self):
+        rng = random.Random(1)
+        self.data = [rng.uniform(-50, 500) for _ in range(2001)]
+
+    def test_percentile_small(self):
+        """PERCENTILE.INC con interpolación entre vecinos."""
+        data = [1, 2, 3, 4]
+        self.assertEqual(percentile(data, 50), 2.5)
+        self.assertAlmostEqual(percentile(data, 90), 3.7)
+        self.assertEqual(percentile(data, 0), 1)
+        self.assertEqual(percentile(data, 100), 4)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+
+    def test_calculate_stats_extra(self):
+        """MEDIAN, SD, VARIANCE y percentiles coinciden con statistics."""
+        stats = calculate_stats(self.data, EXTRA_METRICS, 5)
+        self.assertAlmostEqual(stats["MEDIAN"], statistics.median(self.data))
+        self.assertAlmostEqual(stats["SD"], statistics.stdev(self.data))
+        self.assertAlmostEqual(stats["VARIANCE"],
+                               statistics.variance(self.data))
+        self.assertEqual(stats["MIN"], min(self.data))
+        self.assertEqual(stats["MAX"], max(self.data))
+        for name, pct in (("P50", 50), ("P90", 90), ("P99", 99),
+                          ("P999", 99.9)):
+            self.assertAlmostEqual(stats[name],
+                                   exact_percentile(self.data, pct))
+
+    def test_histogram(self):
+        """Cada intervalo cuenta lo mismo que un recorrido directo."""
+        data = sorted(self.data)
+        lowest, highest = data[0], data[-1]
+        bins = histogram(lambda x: sum(v < x for v in data), len(data),
+                         lowest, highest, 7)
+        self.assertEqual(len(bins), 7)
+        self.assertEqual(sum(amount for _, _, amount in bins), len(data))
+        for i, (low, high, amount) in enumerate(bins):
+            last = i == len(bins) - 1
+            expected = sum(low <= v < high or (last and v == high)
+                           for v in data)
+            self.assertEqual(amount, expected)
+        self.assertEqual(bins[-1][1], highest)
+
+
+class TestStreaming(unittest.TestCase):
+    """Resúmenes de una pasada contra los resultados exactos."""
+
+    def test_small_input_is_exact(self):
+        """Sin compactar, el sketch da los mismos percentiles exactos."""
+        data = [1.0, 2.0, 3.0, 4.0]
+        stream = summarize_stream(streamed(data), EXTRA_METRICS, 3)
+        exact = calculate_stats(data, EXTRA_METRICS, 3)
+        for metric in ("COUNT", "MEAN", "MEDIAN", "SD", "VARIANCE", "MIN",
+                       "MAX", "P50", "P90", "P99", "P999"):
+            self.assertAlmostEqual(stream[metric], exact[metric],
+                                   msg=metric)
+        for metric in ("HIST1", "HIST2", "HIST3"):
+            self.assertEqual(stream[metric], exact[metric], metric)
+        self.assertEqual(stream["MEDIAN"], 2.5)
+        self.assertEqual(stream["MODE"], "#N/A")
+
+    def test_sketch_rank_error(self):
+        """En datos grandes el error de rango queda dentro de lo esperado."""
+        rng = random.Random(3)
+        data = [rng.gauss(0, 1) for _ in range(50000)]
+        sketch = QuantileSketch(200, seed=5)
+        for value in data:
+            sketch.update(value)
+        self.assertLess(sum(len(level) for level in sketch.levels), 3 * 200)
+        ordered = sorted(data)
+        for fraction in (0.1, 0.5, 0.9, 0.99):
+            value = sketch.quantile(fraction)
+            rank = sum(v < value for v in ordered) / len(data)
+            self.assertAlmostEqual(rank, fraction, delta=0.02)
+
+    def test_streaming_stats_merge(self):
+        """Combinar dos resúmenes equivale a resumir todo junto."""
+        rng = random.Random(4)
+        first = [rng.uniform(0, 100) for _ in range(3000)]
+        second = [rng.uniform(50, 300) for _ in range(1000)]
+        merged = streamed(first).merge(streamed(second))
+        data = first + second
+        self.assertEqual(merged.count, len(data))
+        self.assertAlmostEqual(merged.mean, statistics.mean(data))
+        self.assertAlmostEqual(merged.variance, statistics.variance(data))
+        self.assertEqual(merged.minimum, min(data))
+        self.assertEqual(merged.maximum, max(data))
+        self.assertEqual(merged.sketch.count, len(data))
+        median = merged.sketch.quantile(0.5)
+        rank = sum(v < median for v in data) / len(data)
+        self.assertAlmostEqual(rank, 0.5, delta=0.02)
+
+    def test_empty_summary(self):
+        """Un resumen vacío no produce métricas."""
+        self.assertIsNone(summarize_stream(StreamingStats()))
+        self.assertEqual(QuantileSketch().quantiles([0.5, 0.9]),
+                         [None, None])
+
+
+class TestCommandLine(unittest.TestCase):
+    """El programa completo: columna TOTAL y validación de opciones."""
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base_dir)
+
+    def run_script(self, *args):
+        """Ejecuta computeStatistics en el directorio de la prueba."""
+        return subprocess.run(
+            [sys.executable, SCRIPT, *args], cwd=self.base_dir,
+            capture_output=True, text=True, check=False)
+
+    def test_stream_total(self):
+        """--stream combina los archivos en TOTAL con valores exactos."""
+        parts = [[1, 2, 3, 4, 5], [10, 20, 30], [7, 8]]
+        for i, part in enumerate(parts):
+            with open(os.path.join(self.base_dir, f"T{i}.txt"), 'w',
+                      encoding='utf-8') as file:
+                file.write("".join(f"{value}\n" for value in part))
+        result = self.run_script("--stream", "--extra", "ALL", "--bins", "3",
+                                 "T0.txt", "T1.txt", "T2.txt")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        with open(os.path.join(self.base_dir, "StatisticsResults.txt"),
+                  encoding='utf-8') as file:
+            rows = [line.split("\t") for line in file.read().split("\n\n")[0]
+                    .splitlines()]
+        self.assertEqual(rows[0][-1], "TOTAL")
+        total = {row[0]: row[-1] for row in rows[1:]}
+
+        data = [value for part in parts for value in part]
+        exact = calculate_stats(data, EXTRA_METRICS, 3)
+        self.assertEqual(total["COUNT"], str(len(data)))
+        for metric in ("MEAN", "MEDIAN", "SD", "VARIANCE", "P50", "P90",
+                       "P99", "MAX"):
+            self.assertEqual(total[metric], f"{exact[metric]:.2f}", metric)
+        self.assertEqual(total["HIST1"], "8 [1.00, 10.67)")
+        self.assertEqual(total["HIST3"], "1 [20.33, 30.00]")
+
+    def test_invalid_options(self):
+        """--bins < 1 y --sketch-k < 2 se rechazan al leer argumentos."""
+        for args in (["--bins", "0"], ["--bins", "-2"], ["--bins", "x"],
+                     ["--sketch-k", "1"]):
+            with self.subTest(args=args):
+                result = self.run_script("--extra", "HISTOGRAM", *args,
+                                         "T0.txt")
+                self.assertEqual(result.returncode, 2)
+                self.assertIn("se esperaba un entero", result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,19 @@
 """
 Programa: convertNumbers.py
 Descripción: Convierte números de archivos a binario y hexadecimal.
+Entradas: archivos, comprimidos (.gz, .bz2, .xz), directorios, patrones
+glob o '-' para stdin (ver text_input.py).
 Salida: Archivo ConvertionResults.txt con formato tabular.
 """
+import os
 import sys
 import time
 
+# La capa de entrada compartida (text_input.py) está en el directorio padre
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from text_input import (  # noqa: E402 pylint: disable=C0413
+    expand_inputs, read_lines, result_name)
+
 
 def to_binary(number):
     """
@@ -57,23 +65,25 @@ def process_file(filename):
     """
     results = []
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f, 1):
-                text = line.strip()
-                if not text:
-                    continue
-                try:
-                    num = int(text)
-                    bin_val = to_binary(num)
-                    hex_val = to_hexadecimal(num)
-                    results.append((i, num, bin_val, hex_val))
-                except ValueError:
-                    sys.stderr.write(f"Error {filename} linea {i}: "
-                                     f"'{text}' invalido.\n")
-                    results.append((i, text, "#N/A", "#N/A"))
+        for i, line in enumerate(read_lines(filename), 1):
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                num = int(text)
+                bin_val = to_binary(num)
+                hex_val = to_hexadecimal(num)
+                results.append((i, num, bin_val, hex_val))
+            except ValueError:
+                sys.stderr.write(f"Error {filename} linea {i}: "
+                                 f"'{text}' invalido.\n")
+                results.append((i, text, "#N/A", "#N/A"))
     except FileNotFoundError:
         sys.stderr.write(f"Error: Archivo '{filename}' no encontrado.\n")
         return None
+    except OSError as error:
+        sys.stderr.write(f"Error leyendo '{filename}': {error}\n")
+        return None
     return results
 
 
@@ -88,7 +98,7 @@ def print_results(all_results, elapsed_time):
             continue
 
         # Nombre de columna dinámico basado en el archivo (TC1, TC2...)
-        col_name = filename.replace(".txt", "")
+        col_name = result_name(filename).replace(".txt", "")
 
         # Encabezado para este archivo
         header = f"ITEM\t{col_name}\tBIN\tHEX"
@@ -122,11 +132,12 @@ def print_results(all_results, elapsed_time):
 def main():
     """Función principal."""
     if len(sys.argv) < 2:
-        print("Uso: python convertNumbers.py TC1.txt TC2.txt ...")
+        print("Uso: python convertNumbers.py TC1.txt TC2.txt.gz datos/ "
+              "'TC*.txt' - ...")
         sys.exit(1)
 
     start_time = time.time()
-    filenames = sys.argv[1:]
+    filenames = expand_inputs(sys.argv[1:])
     all_data = {}
 
     for fname in filenames:
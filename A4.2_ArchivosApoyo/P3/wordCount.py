@@ -1,12 +1,19 @@
 """
 Programa: wordCount.py
 Descripción: Cuenta frecuencias de palabras y genera archivos de resultados individuales.
+Entradas: archivos, comprimidos (.gz, .bz2, .xz), directorios, patrones
+glob o '-' para stdin (ver text_input.py).
 Salida: Archivos [Nombre].Results.txt con formato tabular según lo especificado en las instrucciones
 """
 import sys
 import time
 import os
 
+# La capa de entrada compartida (text_input.py) está en el directorio padre
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from text_input import (  # noqa: E402 pylint: disable=C0413
+    expand_inputs, read_lines, result_name)
+
 
 def get_words(filename):
     """
@@ -14,16 +21,15 @@ def get_words(filename):
     """
     words = []
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            for line in file:
-                clean_line = line.strip()
-                if not clean_line:
-                    continue
-                # Separar por espacios
-                line_words = clean_line.split()
-                if not line_words:
-                    continue
-                words.extend(line_words)
+        for line in read_lines(filename):
+            clean_line = line.strip()
+            if not clean_line:
+                continue
+            # Separar por espacios
+            line_words = clean_line.split()
+            if not line_words:
+                continue
+            words.extend(line_words)
     except FileNotFoundError:
         sys.stderr.write(f"Error: El archivo '{filename}' no existe.\n")
         return None
@@ -60,8 +66,8 @@ def write_results_file(filename, frequencies, elapsed_time):
     Formato: Row Labels [tab] Count of [Nombre]
     Orden: Frecuencia Descendente.
     """
-    # 1. Definir nombre de salida: TC1.txt -> TC1.Results.txt
-    base_name = os.path.basename(filename)
+    # 1. Definir nombre de salida: TC1.txt (o TC1.txt.gz) -> TC1.Results.txt
+    base_name = os.path.basename(result_name(filename))
     name_no_ext = os.path.splitext(base_name)[0]
     output_filename = f"{name_no_ext}.Results.txt"
 
@@ -93,10 +99,11 @@ def write_results_file(filename, frequencies, elapsed_time):
 def main():
     """Función principal."""
     if len(sys.argv) < 2:
-        print("Uso: python wordCount.py TC1.txt TC2.txt ...")
+        print("Uso: python wordCount.py TC1.txt TC2.txt.gz textos/ "
+              "'TC*.txt' - ...")
         sys.exit(1)
 
-    input_files = sys.argv[1:]
+    input_files = expand_inputs(sys.argv[1:])
 
     # Procesamos cada archivo de forma independiente
     for filename in input_files:
@@ -0,0 +1,142 @@
+"""
+Pruebas de la capa de entrada compartida (text_input.py): archivos
+comprimidos sanos, truncados y dañados, expansión de directorios y
+patrones, entrada estándar y nombres de resultado.
+"""
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from text_input import STDIN, expand_inputs, read_lines, result_name
+
+# Contenido de prueba: suficiente para varios lotes pequeños
+LINES = [f"{i}\n" for i in range(5000)]
+DATA = "".join(LINES).encode('utf-8')
+
+# Extensión -> función que comprime bytes en ese formato
+COMPRESS = {
+    '.gz': gzip.compress,
+    '.bz2': bz2.compress,
+    '.xz': lzma.compress,
+}
+
+
+class TestReadLines(unittest.TestCase):
+    """Lectura por lotes de texto plano y comprimido."""
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base_dir)
+
+    def make_file(self, name, content):
+        """Escribe `content` (bytes) en el directorio de la prueba."""
+        path = os.path.join(self.base_dir, name)
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_plain_and_compressed(self):
+        """Texto y comprimidos entregan las mismas líneas, en orden."""
+        sources = [self.make_file('datos.txt', DATA)]
+        sources += [self.make_file(f'datos.txt{ext}', compress(DATA))
+                    for ext, compress in COMPRESS.items()]
+        for source in sources:
+            with self.subTest(source=source):
+                self.assertEqual(
+                    list(read_lines(source, batch_bytes=1024)), LINES)
+
+    def test_truncated_archives(self):
+        """Un comprimido cortado se reporta como OSError."""
+        for ext, compress in COMPRESS.items():
+            packed = compress(DATA)
+            path = self.make_file(f'corto.txt{ext}', packed[:len(packed) // 2])
+            with self.subTest(ext=ext), self.assertRaises(OSError):
+                list(read_lines(path))
+
+    def test_corrupt_archives(self):
+        """Un comprimido con el cuerpo dañado falla en vez de colgarse."""
+        for ext, compress in COMPRESS.items():
+            packed = bytearray(compress(DATA))
+            # Conservar el encabezado y dañar el cuerpo
+            packed[20:80] = b'\xff' * 60
+            path = self.make_file(f'malo.txt{ext}', bytes(packed))
+            with self.subTest(ext=ext), self.assertRaises(OSError):
+                list(read_lines(path))
+
+    def test_missing_file(self):
+        """Un archivo inexistente lanza FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            list(read_lines(os.path.join(self.base_dir, 'no_existe.txt')))
+
+    def test_invalid_utf8(self):
+        """Bytes que no son UTF-8 lanzan UnicodeDecodeError."""
+        path = self.make_file('latin.txt', "año\n".encode('latin-1'))
+        with self.assertRaises(UnicodeDecodeError):
+            list(read_lines(path))
+
+    def test_stop_early(self):
+        """Dejar de iterar a la mitad libera al hilo lector."""
+        path = self.make_file('datos.txt', DATA)
+        lines = read_lines(path, batch_bytes=64, prefetch=1)
+        self.assertEqual(next(lines), LINES[0])
+        lines.close()
+
+    def test_stdin(self):
+        """'-' lee la entrada estándar."""
+        code = ("from text_input import read_lines; "
+                "print(sum(1 for _ in read_lines('-')))")
+        result = subprocess.run(
+            [sys.executable, '-c', code], input=DATA, capture_output=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        self.assertEqual(result.stdout.decode().strip(), str(len(LINES)))
+
+
+class TestExpandInputs(unittest.TestCase):
+    """Expansión de argumentos y nombres de resultado."""
+
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base_dir)
+        for name in ('b.txt', 'a.txt.gz', '.oculto.txt', 'c.csv'):
+            with open(os.path.join(self.base_dir, name), 'wb'):
+                pass
+        os.mkdir(os.path.join(self.base_dir, 'sub'))
+
+    def path(self, *parts):
+        """Ruta dentro del directorio de la prueba."""
+        return os.path.join(self.base_dir, *parts)
+
+    def test_directory(self):
+        """Un directorio se expande a sus archivos visibles, en orden."""
+        self.assertEqual(expand_inputs([self.base_dir]),
+                         [self.path('a.txt.gz'), self.path('b.txt'),
+                          self.path('c.csv')])
+
+    def test_glob(self):
+        """Un patrón se expande a sus coincidencias, en orden."""
+        self.assertEqual(expand_inputs([self.path('*.txt*')]),
+                         [self.path('a.txt.gz'), self.path('b.txt')])
+
+    def test_unmatched_and_stdin(self):
+        """Lo que no coincide se conserva y '-' pasa sin cambios."""
+        missing = self.path('*.json')
+        self.assertEqual(expand_inputs([STDIN, missing, 'nada.txt']),
+                         [STDIN, missing, 'nada.txt'])
+
+    def test_result_name(self):
+        """El nombre del resultado no lleva la extensión de compresión."""
+        self.assertEqual(result_name('TC1.txt.gz'), 'TC1.txt')
+        self.assertEqual(result_name('datos/TC2.txt.xz'), 'datos/TC2.txt')
+        self.assertEqual(result_name('TC3.txt'), 'TC3.txt')
+        self.assertEqual(result_name('notas.tar'), 'notas.tar')
+        self.assertEqual(result_name(STDIN), 'stdin')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Programa: text_input.py
+Descripción: Capa de entrada compartida por computeStatistics,
+convertNumbers y wordCount. Acepta archivos de texto, archivos
+comprimidos (.gz, .bz2, .xz) que se leen sin descomprimir a disco,
+directorios (sus archivos, en orden), patrones glob y '-' para stdin.
+La lectura y descompresión corren en un hilo que entrega lotes de
+líneas por una cola acotada, mientras el programa procesa los
+anteriores.
+"""
+import bz2
+import glob
+import gzip
+import lzma
+import os
+import queue
+import threading
+import zlib
+
+# Argumento que representa la entrada estándar
+STDIN = '-'
+
+# Extensión -> función que abre el archivo comprimido en modo texto
+COMPRESSED = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+# Bytes aproximados por lote de líneas y lotes leídos por adelantado
+BATCH_BYTES = 1 << 20
+PREFETCH = 4
+
+
+def expand_inputs(args):
+    """
+    Convierte los argumentos de la línea de comandos en la lista de
+    entradas a procesar. Los directorios se expanden a sus archivos
+    (sin ocultos, en orden alfabético) y los patrones glob a sus
+    coincidencias. Un argumento sin coincidencias se conserva para que
+    el programa reporte que no existe.
+    """
+    sources = []
+    for arg in args:
+        if arg == STDIN:
+            sources.append(arg)
+            continue
+        is_pattern = any(char in arg for char in '*?[')
+        matches = sorted(glob.glob(arg, recursive=True)) \
+            if is_pattern else [arg]
+        if not matches:
+            sources.append(arg)
+        for path in matches:
+            if os.path.isdir(path):
+                sources.extend(sorted(
+                    entry.path for entry in os.scandir(path)
+                    if entry.is_file() and not entry.name.startswith('.')))
+            else:
+                sources.append(path)
+    return sources
+
+
+def result_name(source):
+    """
+    Nombre con el que se reportan los resultados de una entrada: la ruta
+    sin la extensión de compresión (TC1.txt.gz -> TC1.txt), o 'stdin'.
+    """
+    if source == STDIN:
+        return 'stdin'
+    stem, extension = os.path.splitext(source)
+    return stem if extension in COMPRESSED else source
+
+
+def open_text(source):
+    """Abre una entrada (texto, comprimida o stdin) en modo texto UTF-8."""
+    if source == STDIN:
+        return open(0, 'r', encoding='utf-8', closefd=False)
+    opener = COMPRESSED.get(os.path.splitext(source)[1], open)
+    return opener(source, 'rt', encoding='utf-8')
+
+
+def read_lines(source, batch_bytes=BATCH_BYTES, prefetch=PREFETCH):
+    """
+    Genera las líneas de una entrada. Un hilo lector abre, descomprime y
+    decodifica el archivo por lotes y los deja en una cola de a lo más
+    `prefetch` lotes. Los errores de lectura se relanzan en quien itera:
+    FileNotFoundError, UnicodeDecodeError, u OSError si el comprimido
+    está dañado.
+    """
+    batches = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def reader():
+        # Lo último en la cola es siempre un lote vacío (fin) o un error,
+        # para que quien itera nunca se quede esperando
+        end = []
+        try:
+            with open_text(source) as file:
+                while not stop.is_set():
+                    lines = file.readlines(batch_bytes)
+                    if not lines:
+                        break
+                    batches.put(lines)
+        except (EOFError, lzma.LZMAError, zlib.error) as error:
+            # Comprimido truncado o dañado: se reporta como error de lectura
+            end = OSError(f"comprimido dañado ({error})")
+        except Exception as error:  # pylint: disable=broad-except
+            end = error
+        finally:
+            batches.put(end)
+
+    thread = threading.Thread(target=reader, daemon=True,
+                              name=f"reader:{source}")
+    thread.start()
+    try:
+        while True:
+            batch = batches.get()
+            if isinstance(batch, Exception):
+                raise batch
+            if not batch:
+                return
+            yield from batch
+    finally:
+        # Si se deja de iterar antes del final, liberar al lector
+        stop.set()
+        while thread.is_alive():
+            try:
+                batches.get_nowait()
+            except queue.Empty:
+                thread.join(0.01)
@@ -0,0 +1,89 @@
+"""
+Programa: bench_availability.py
+Descripción: Mide el calendario de ocupación (hotel_calendar) con un
+millón de reservaciones y lo compara con el recorrido lineal de todas
+las reservaciones que haría una verificación sin índice.
+Uso: python bench_availability.py [--reservations N] [--queries N]
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from hotel_calendar import OccupancyCalendar
+
+START = date(2026, 1, 1)
+HORIZON_DAYS = 730
+
+
+def random_stay(rng):
+    """Estancia aleatoria de 1 a 14 noches dentro del horizonte."""
+    check_in = START + timedelta(days=rng.randrange(HORIZON_DAYS))
+    return check_in, check_in + timedelta(days=rng.randint(1, 14))
+
+
+def linear_max_occupancy(stays, check_in, check_out):
+    """Ocupación máxima recorriendo todas las estancias (sin índice)."""
+    nights = {}
+    for stay_in, stay_out in stays:
+        if stay_in < check_out and check_in < stay_out:
+            first = max(stay_in, check_in).toordinal()
+            last = min(stay_out, check_out).toordinal()
+            for day in range(first, last):
+                nights[day] = nights.get(day, 0) + 1
+    return max(nights.values(), default=0)
+
+
+def timed(label, count, func):
+    """Ejecuta `func` y reporta el tiempo total y por operación."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label}\t{count}\t{elapsed:.3f}\t"
+          f"{elapsed / count * 1e6:.2f}")
+    return result
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--reservations', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=100_000)
+    parser.add_argument('--linear-queries', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(2026)
+    stays = [random_stay(rng) for _ in range(args.reservations)]
+    queries = [random_stay(rng) for _ in range(args.queries)]
+    calendar = OccupancyCalendar()
+
+    print("OPERACIÓN\tN\tTOTAL (s)\tPOR OP (µs)")
+
+    def insert_all():
+        for stay in stays:
+            calendar.add(*stay)
+
+    def query_all():
+        return [calendar.max_occupancy(*q) for q in queries]
+
+    def occupancy_months():
+        for check_in, _ in queries[:args.queries // 100]:
+            calendar.occupancy_range(check_in,
+                                     check_in + timedelta(days=30))
+
+    def linear_sample():
+        return [linear_max_occupancy(stays, *q)
+                for q in queries[:args.linear_queries]]
+
+    timed("insertar estancia", len(stays), insert_all)
+    indexed = timed("disponibilidad (índice)", len(queries), query_all)
+    timed("ocupación 30 días", args.queries // 100, occupancy_months)
+    linear = timed("disponibilidad (lineal)", args.linear_queries,
+                   linear_sample)
+
+    assert linear == indexed[:args.linear_queries], "resultados distintos"
+    print(f"\nDías cubiertos por el árbol: {calendar.size}")
+
+
+if __name__ == "__main__":
+    main()
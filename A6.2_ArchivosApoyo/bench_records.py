@@ -0,0 +1,108 @@
+"""
+Programa: bench_records.py
+Descripción: Compara el costo en memoria por registro (dict, entidad con
+__slots__ y fila en tupla) y la velocidad de guardado/carga del formato
+anterior (JSON con indent=4) contra JSON compacto, JSON columnar y el
+formato binario de hotel_storage.
+Uso: python bench_records.py [--records N]
+"""
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from hotel_storage import COMPACT, dump_rows, load_rows, to_row
+from hotel_system import Hotel
+
+FILE = 'hotels.json'
+
+
+def make_records(count):
+    """Genera registros de hotel como los que produce create_hotel."""
+    return [Hotel(f"H{i}", f"Hotel {i}", "CDMX", i % 300).to_dict()
+            for i in range(count)]
+
+
+def memory_per_item(build, count):
+    """Bytes por elemento de la colección que construye `build`."""
+    gc.collect()
+    tracemalloc.start()
+    items = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return current / count
+
+
+def measure_format(label, path, save, load):
+    """Guarda y carga con las funciones dadas; imprime tiempos y tamaño."""
+    start = time.perf_counter()
+    save(path)
+    saved = time.perf_counter() - start
+    start = time.perf_counter()
+    load(path)
+    loaded = time.perf_counter() - start
+    print(f"{label}\t{saved:.3f}\t{loaded:.3f}\t"
+          f"{os.path.getsize(path) / 1024:.0f}")
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--records', type=int, default=200_000)
+    args = parser.parse_args()
+    count = args.records
+    records = make_records(count)
+
+    print("REPRESENTACIÓN\tBYTES/REGISTRO")
+    for label, build in (
+            ("dict", lambda: [dict(r) for r in records]),
+            ("Hotel (__slots__)", lambda: [Hotel.from_dict(r)
+                                           for r in records]),
+            ("tupla (fila)", lambda: [to_row(FILE, r) for r in records])):
+        print(f"{label}\t{memory_per_item(build, count):.0f}")
+
+    rows = [to_row(FILE, r) for r in records]
+
+    def dump_json(indent):
+        def save(path):
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(records, file, indent=indent,
+                          separators=None if indent else COMPACT)
+        return save
+
+    def load_json(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def dump_columnar(binary):
+        def save(path):
+            with open(path, 'wb' if binary else 'w',
+                      encoding=None if binary else 'utf-8') as file:
+                dump_rows(FILE, rows, file, binary)
+        return save
+
+    def load_columnar(binary):
+        def load(path):
+            with open(path, 'rb' if binary else 'r',
+                      encoding=None if binary else 'utf-8') as file:
+                return load_rows(FILE, file, binary)
+        return load
+
+    print(f"\nFORMATO ({count} registros)\tGUARDAR (s)\tCARGAR (s)\tKB")
+    with tempfile.TemporaryDirectory() as tmp:
+        measure_format("JSON indent=4 (anterior)", os.path.join(tmp, 'a'),
+                       dump_json(4), load_json)
+        measure_format("JSON compacto", os.path.join(tmp, 'b'),
+                       dump_json(None), load_json)
+        measure_format("JSON columnar", os.path.join(tmp, 'c'),
+                       dump_columnar(False), load_columnar(False))
+        measure_format("binario (marshal)", os.path.join(tmp, 'd'),
+                       dump_columnar(True), load_columnar(True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Programa: bench_service.py
+Descripción: Generador de carga para hotel_service.py. Abre conexiones
+keep-alive concurrentes contra localhost y reporta peticiones/s y las
+latencias p50/p99 por tipo de operación.
+Uso: python bench_service.py [--requests N] [--connections N]
+                             [--backend log|sqlite|json]
+                             [--host H --port P]  (servicio ya iniciado)
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+HOTELS = 10
+CUSTOMERS = 100
+
+
+async def request(reader, writer, method, path, payload=None):
+    """Envía una petición HTTP/1.1 y devuelve (estado, contenido)."""
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def populate(host, port):
+    """Crea los hoteles y clientes sobre los que corre la carga."""
+    reader, writer = await asyncio.open_connection(host, port)
+    for i in range(HOTELS):
+        await request(reader, writer, 'POST', '/hotels', {
+            "hotel_id": f"H{i}", "name": f"Hotel {i}",
+            "location": "CDMX", "rooms": 10 ** 9})
+    for i in range(CUSTOMERS):
+        await request(reader, writer, 'POST', '/customers', {
+            "customer_id": f"C{i}", "name": f"Cliente {i}",
+            "email": f"c{i}@mail.com"})
+    writer.close()
+
+
+def operation(i):
+    """Mezcla fija: 70% lectura de hotel, 10% de cliente, 20% reserva."""
+    slot = i % 10
+    if slot < 7:
+        return 'GET hotel', 'GET', f"/hotels/H{i % HOTELS}", None
+    if slot == 7:
+        return 'GET customer', 'GET', f"/customers/C{i % CUSTOMERS}", None
+    return 'POST reservation', 'POST', '/reservations', {
+        "reservation_id": f"R{i}", "customer_id": f"C{i % CUSTOMERS}",
+        "hotel_id": f"H{i % HOTELS}"}
+
+
+async def worker(host, port, ops, latencies):
+    """Ejecuta secuencialmente una porción de operaciones."""
+    reader, writer = await asyncio.open_connection(host, port)
+    for i in ops:
+        kind, method, path, payload = operation(i)
+        start = time.perf_counter()
+        status, _ = await request(reader, writer, method, path, payload)
+        latencies.setdefault(kind, []).append(time.perf_counter() - start)
+        if status >= 400:
+            latencies.setdefault('errors', []).append(status)
+    writer.close()
+
+
+def percentile(sorted_values, pct):
+    """Percentil por rango más cercano de una lista ordenada."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_load(host, port, total, connections):
+    """Lanza la carga y devuelve (latencias por tipo, segundos)."""
+    await populate(host, port)
+    latencies = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(host, port, range(c, total, connections), latencies)
+        for c in range(connections)
+    ))
+    return latencies, time.perf_counter() - start
+
+
+def print_report(latencies, elapsed):
+    """Imprime la tabla de resultados."""
+    errors = latencies.pop('errors', [])
+    every = sorted(v for values in latencies.values() for v in values)
+    print("OPERACIÓN\tN\tp50 (ms)\tp99 (ms)")
+    for kind, values in sorted(latencies.items()) + [("TOTAL", every)]:
+        values = sorted(values)
+        print(f"{kind}\t{len(values)}\t{percentile(values, 50) * 1000:.3f}"
+              f"\t{percentile(values, 99) * 1000:.3f}")
+    print(f"\nPeticiones/s: {len(every) / elapsed:.1f}")
+    print(f"Errores: {len(errors)}")
+
+
+def start_server(backend, data_dir):
+    """Inicia hotel_service.py en otro proceso; devuelve (proceso, puerto)."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'hotel_service.py')
+    process = subprocess.Popen(  # pylint: disable=R1732
+        [sys.executable, script, '--port', str(port),
+         '--data-dir', data_dir, '--backend', backend])
+    for _ in range(100):
+        try:
+            socket.create_connection(('127.0.0.1', port)).close()
+            return process, port
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("El servicio no arrancó.")
+
+
+def measure(args):
+    """
+    Corre la carga contra --host/--port o, si no se dio puerto, contra un
+    servicio propio sobre un directorio temporal. Devuelve
+    (latencias, tiempo total).
+    """
+    if args.port:
+        return asyncio.run(
+            run_load(args.host, args.port, args.requests, args.connections))
+    with tempfile.TemporaryDirectory() as data_dir:
+        process, port = start_server(args.backend, data_dir)
+        try:
+            return asyncio.run(run_load(
+                '127.0.0.1', port, args.requests, args.connections))
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--connections', type=int, default=32)
+    parser.add_argument('--backend', default='log')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int)
+    args = parser.parse_args()
+    print_report(*measure(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Índice de ocupación por fecha para las reservaciones con fechas.
+
+Cada hotel tiene un OccupancyCalendar: un árbol de segmentos sobre los
+días (ordinales de fecha) con suma diferida, que registra cuántas
+habitaciones están ocupadas cada noche. Agregar o quitar una estancia
+[check_in, check_out) y consultar la ocupación máxima de un rango
+cuestan O(log n), con n el número de días cubiertos.
+"""
+
+from datetime import date
+
+# Tamaño mínimo (en días) del árbol al crearse
+MIN_SPAN = 64
+
+
+def to_date(value):
+    """Convierte una fecha ISO 'AAAA-MM-DD' (o un date) en date."""
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def parse_stay(check_in, check_out):
+    """Valida una estancia; devuelve (entrada, salida) como date."""
+    start, end = to_date(check_in), to_date(check_out)
+    if start >= end:
+        raise ValueError("check_out debe ser posterior a check_in")
+    return start, end
+
+
+class OccupancyCalendar:
+    """Ocupación por noche de un hotel (árbol de segmentos max/suma)."""
+
+    def __init__(self):
+        self.origin = None
+        self.size = 0
+        self._used = None
+        self._height = 0
+        self._max = []
+        self._add = []
+
+    def _ensure(self, lo, hi):
+        """
+        Amplía el árbol para cubrir los ordinales [lo, hi). El nuevo
+        tamaño es la potencia de dos que cubre los días usados y el
+        espacio sobrante se reparte a ambos lados del rango.
+        """
+        if self._used is not None:
+            lo, hi = min(lo, self._used[0]), max(hi, self._used[1])
+        self._used = (lo, hi)
+        if self.size and self.origin <= lo and hi <= self.origin + self.size:
+            return
+        values = self._leaves()
+        size = MIN_SPAN
+        while size < hi - lo:
+            size *= 2
+        origin = lo - (size - (hi - lo)) // 2
+
+        tree = [0] * (2 * size)
+        if values:
+            # Copiar solo los días viejos que caen en el nuevo rango; los
+            # de fuera están vacíos porque quedan fuera de _used
+            start = max(self.origin, origin)
+            end = min(self.origin + self.size, origin + size)
+            tree[size + start - origin:size + end - origin] = \
+                values[start - self.origin:end - self.origin]
+        for i in range(size - 1, 0, -1):
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+        self.origin, self.size = origin, size
+        self._height = size.bit_length() - 1
+        self._max, self._add = tree, [0] * size
+
+    def _leaves(self):
+        """Ocupación de cada día cubierto, con las sumas ya propagadas."""
+        for i in range(1, self.size):
+            if self._add[i]:
+                self._apply(2 * i, self._add[i])
+                self._apply(2 * i + 1, self._add[i])
+                self._add[i] = 0
+        return self._max[self.size:]
+
+    def _apply(self, node, value):
+        """Suma `value` a todo el subárbol de `node`."""
+        self._max[node] += value
+        if node < self.size:
+            self._add[node] += value
+
+    def _pull(self, node):
+        """Recalcula los máximos de los ancestros de una hoja."""
+        tree, add = self._max, self._add
+        while node > 1:
+            node >>= 1
+            tree[node] = max(tree[2 * node], tree[2 * node + 1]) + add[node]
+
+    def _push(self, node):
+        """Baja las sumas pendientes de los ancestros de una hoja."""
+        add = self._add
+        for shift in range(self._height, 0, -1):
+            i = node >> shift
+            if add[i]:
+                self._apply(2 * i, add[i])
+                self._apply(2 * i + 1, add[i])
+                add[i] = 0
+
+    def add(self, check_in, check_out, count=1):
+        """Ocupa `count` habitaciones las noches de [check_in, check_out)."""
+        lo, hi = check_in.toordinal(), check_out.toordinal()
+        self._ensure(lo, hi)
+        left = lo - self.origin + self.size
+        right = hi - self.origin + self.size
+        first, last = left, right - 1
+        while left < right:
+            if left & 1:
+                self._apply(left, count)
+                left += 1
+            if right & 1:
+                right -= 1
+                self._apply(right, count)
+            left >>= 1
+            right >>= 1
+        self._pull(first)
+        self._pull(last)
+
+    def remove(self, check_in, check_out, count=1):
+        """Libera las habitaciones ocupadas por una estancia."""
+        self.add(check_in, check_out, -count)
+
+    def max_occupancy(self, check_in, check_out):
+        """Máximo de habitaciones ocupadas en una noche de [in, out)."""
+        if not self.size:
+            return 0
+        lo = max(check_in.toordinal(), self.origin)
+        hi = min(check_out.toordinal(), self.origin + self.size)
+        if lo >= hi:
+            return 0
+        left = lo - self.origin + self.size
+        right = hi - self.origin + self.size
+        self._push(left)
+        self._push(right - 1)
+        result = 0
+        while left < right:
+            if left & 1:
+                result = max(result, self._max[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                result = max(result, self._max[right])
+            left >>= 1
+            right >>= 1
+        return result
+
+    def occupancy(self, day):
+        """Habitaciones ocupadas la noche de `day`."""
+        return self.max_occupancy(day, date.fromordinal(day.toordinal() + 1))
+
+    def occupancy_range(self, start, end):
+        """Lista de (día, ocupadas) para cada noche de [start, end)."""
+        return [
+            (date.fromordinal(d), self.occupancy(date.fromordinal(d)))
+            for d in range(start.toordinal(), end.toordinal())
+        ]
+
+
+class CalendarCache:
+    """
+    Calendarios por hotel, construidos bajo demanda a partir de las
+    reservaciones y mantenidos al crear o cancelar. Es un índice del
+    proceso: se invalida cuando cambia el motor, se reemplazan datos o
+    el motor reporta cambios externos (ver sync).
+    """
+
+    def __init__(self):
+        self._calendars = {}
+        self._generation = None
+
+    def sync(self, generation):
+        """
+        Olvida los calendarios si la generación del motor cambió desde la
+        última llamada, es decir, si hay datos que no pasaron por aquí.
+        """
+        if generation != self._generation:
+            self._calendars.clear()
+            self._generation = generation
+
+    def get(self, hotel_id, load_reservations):
+        """Devuelve el calendario del hotel, construyéndolo si falta."""
+        calendar = self._calendars.get(hotel_id)
+        if calendar is None:
+            calendar = OccupancyCalendar()
+            for res in load_reservations(hotel_id):
+                if res.get('check_in'):
+                    calendar.add(*parse_stay(res['check_in'],
+                                             res['check_out']))
+            self._calendars[hotel_id] = calendar
+        return calendar
+
+    def discard(self, hotel_id):
+        """Olvida el calendario de un hotel."""
+        self._calendars.pop(hotel_id, None)
+
+    def clear(self):
+        """Olvida todos los calendarios."""
+        self._calendars.clear()
+        self._generation = None
@@ -0,0 +1,266 @@
+"""
+Programa: hotel_service.py
+Descripción: Servicio local asyncio que expone Hotel, Customer y
+Reservation sobre HTTP/JSON. El estado se mantiene en memoria
+(LogBackend por defecto); todas las escrituras pasan, en orden, por
+una única tarea escritora y las lecturas corren en hilos lectores, de
+modo que ninguna de las dos bloquea el ciclo de eventos.
+Uso: python hotel_service.py [--host H] [--port P] [--data-dir DIR]
+                             [--backend log|sqlite|json|memory]
+                             [--verbose]
+
+Rutas:
+    POST   /hotels                      GET|PATCH|DELETE /hotels/{id}
+    POST   /customers                   GET|PATCH|DELETE /customers/{id}
+    POST   /reservations                GET|DELETE       /reservations/{id}
+    GET    /hotels/{id}/reservations    GET /customers/{id}/reservations
+"""
+import argparse
+import asyncio
+import functools
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import unquote, urlsplit
+
+from hotel_system import (
+    BACKENDS, KEY_FIELDS, Customer, FileManager, Hotel, Reservation,
+    make_backend
+)
+
+# Recurso -> (entidad, crear, modificar, eliminar)
+RESOURCES = {
+    'hotels': (Hotel, Hotel.create_hotel, Hotel.modify_hotel_info,
+               Hotel.delete_hotel),
+    'customers': (Customer, Customer.create_customer,
+                  Customer.modify_customer_info, Customer.delete_customer),
+    'reservations': (Reservation, Reservation.create_reservation, None,
+                     Reservation.cancel_reservation),
+}
+
+# Hilos que atienden las lecturas fuera del ciclo de eventos
+READERS = 4
+
+# Recurso padre -> campo de la reservación que lo referencia
+RESERVATION_FILTERS = {
+    'hotels': 'hotel_id',
+    'customers': 'customer_id',
+}
+
+
+class HttpError(Exception):
+    """Error que se traduce directamente en una respuesta HTTP."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class HotelService:
+    """
+    Atiende las peticiones HTTP. Las escrituras se encolan y una sola
+    tarea las ejecuta en orden en un hilo dedicado. Las lecturas también
+    salen del ciclo de eventos: corren en un grupo de hilos lectores,
+    porque FileManager.get/find toman el candado de la transacción (y,
+    según el motor, flock y stat de archivos) y se bloquearían mientras
+    el escritor tiene una transacción abierta.
+    """
+
+    def __init__(self, readers=READERS):
+        self._queue = None
+        self._writer_task = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._readers = ThreadPoolExecutor(max_workers=readers)
+
+    async def start(self):
+        """Arranca la tarea escritora."""
+        self._queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    async def stop(self):
+        """Detiene la tarea escritora y los hilos."""
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._executor.shutdown()
+        self._readers.shutdown()
+
+    async def _write_loop(self):
+        """Ejecuta las escrituras encoladas, una a la vez."""
+        loop = asyncio.get_running_loop()
+        while True:
+            func, future = await self._queue.get()
+            try:
+                result = await loop.run_in_executor(self._executor, func)
+            except Exception as error:  # pylint: disable=broad-except
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    async def submit(self, func, *args, **kwargs):
+        """Encola una escritura y espera su resultado."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(
+            (functools.partial(func, *args, **kwargs), future))
+        return await future
+
+    async def read(self, func, *args):
+        """Ejecuta una lectura en un hilo lector y espera su resultado."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._readers, functools.partial(func, *args))
+
+    async def handle(self, method, path, body):
+        """Resuelve una petición; devuelve (estado, contenido)."""
+        parts = [unquote(p) for p in path.split('/') if p]
+        if not parts or parts[0] not in RESOURCES:
+            raise HttpError(HTTPStatus.NOT_FOUND, "recurso no encontrado")
+        if len(parts) == 1:
+            return await self._handle_collection(parts[0], method, body)
+        if len(parts) == 3 and parts[2] == 'reservations' \
+                and parts[0] in RESERVATION_FILTERS and method == 'GET':
+            return HTTPStatus.OK, await self.read(
+                FileManager.find, Reservation.FILE,
+                RESERVATION_FILTERS[parts[0]], parts[1])
+        if len(parts) != 2:
+            raise HttpError(HTTPStatus.NOT_FOUND, "recurso no encontrado")
+        return await self._handle_item(parts[0], parts[1], method, body)
+
+    async def _handle_collection(self, resource, method, body):
+        """POST /{recurso}: da de alta un registro."""
+        entity, create, _, _ = RESOURCES[resource]
+        if method != 'POST':
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED,
+                            "método no permitido")
+        if not isinstance(body, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "se esperaba un objeto")
+        if not await self.submit(create, **body):
+            raise HttpError(HTTPStatus.CONFLICT, "operación rechazada")
+        return HTTPStatus.CREATED, await self.read(
+            FileManager.get, entity.FILE, body[KEY_FIELDS[entity.FILE]])
+
+    async def _handle_item(self, resource, key, method, body):
+        """GET, PATCH o DELETE sobre /{recurso}/{id}."""
+        entity, _, modify, delete = RESOURCES[resource]
+        if method == 'GET':
+            record = await self.read(FileManager.get, entity.FILE, key)
+            if record is None:
+                raise HttpError(HTTPStatus.NOT_FOUND, "no encontrado")
+            return HTTPStatus.OK, record
+        if method == 'PATCH' and modify is not None:
+            if not isinstance(body, dict):
+                raise HttpError(HTTPStatus.BAD_REQUEST,
+                                "se esperaba un objeto")
+            if not await self.submit(modify, key, **body):
+                # Distinguir un registro inexistente de un cambio inválido
+                if await self.read(FileManager.get, entity.FILE, key) is None:
+                    raise HttpError(HTTPStatus.NOT_FOUND, "no encontrado")
+                raise HttpError(HTTPStatus.BAD_REQUEST, "cambio rechazado")
+            return HTTPStatus.OK, await self.read(
+                FileManager.get, entity.FILE, key)
+        if method == 'DELETE':
+            if not await self.submit(delete, key):
+                raise HttpError(HTTPStatus.NOT_FOUND, "no encontrado")
+            return HTTPStatus.OK, {"deleted": key}
+        raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "método no permitido")
+
+    async def dispatch(self, method, target, raw_body):
+        """Decodifica el cuerpo, atiende la petición y mapea errores."""
+        try:
+            body = json.loads(raw_body) if raw_body else None
+            return await self.handle(method, urlsplit(target).path, body)
+        except HttpError as error:
+            return error.status, {"error": error.message}
+        except (ValueError, TypeError, KeyError):
+            return HTTPStatus.BAD_REQUEST, {"error": "petición inválida"}
+
+    @staticmethod
+    async def read_request(reader):
+        """
+        Lee una petición HTTP/1.1; devuelve (método, destino, versión,
+        encabezados, cuerpo), o None si el cliente cerró la conexión.
+        """
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        method, target, version = request_line.decode('latin-1').split()
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        raw_body = await reader.readexactly(length) if length else b''
+        return method, target, version, headers, raw_body
+
+    async def serve_client(self, reader, writer):
+        """Atiende una conexión HTTP/1.1 con keep-alive."""
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                method, target, version, headers, raw_body = request
+                status, payload = await self.dispatch(method, target, raw_body)
+                keep_alive = (version == 'HTTP/1.1' and
+                              headers.get('connection', '').lower() != 'close')
+                content = json.dumps(payload).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}"
+                    f"\r\n\r\n".encode('latin-1') + content)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host, port):
+    """Arranca el servicio y atiende hasta ser cancelado."""
+    service = HotelService()
+    await service.start()
+    server = await asyncio.start_server(service.serve_client, host, port)
+    sys.stderr.write(f"Servicio escuchando en http://{host}:{port}\n")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--data-dir', default=os.getcwd())
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='log')
+    parser.add_argument('--verbose', action='store_true',
+                        help="muestra los mensajes de hotel_system")
+    args = parser.parse_args()
+
+    FileManager.set_backend(make_backend(args.backend, args.data_dir))
+    if not args.verbose:
+        sys.stdout = open(  # pylint: disable=R1732
+            os.devnull, 'w', encoding='utf-8')
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        FileManager.backend.close()
+
+
+if __name__ == "__main__":
+    main()
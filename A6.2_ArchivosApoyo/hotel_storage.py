@@ -0,0 +1,744 @@
+"""
+Motores de almacenamiento para el sistema de hoteles.
+
+Cada motor expone la misma interfaz mínima que usa FileManager:
+load_data, save_data, get, find, write y transaction. Los registros se
+identifican por la llave primaria de su entidad (ver KEY_FIELDS) y
+tienen los campos de FIELDS.
+"""
+
+import os
+import json
+import marshal
+import sqlite3
+import threading
+from contextlib import contextmanager
+from itertools import chain
+
+try:
+    import fcntl
+except ImportError:  # Windows: solo se serializan los hilos del proceso
+    fcntl = None
+
+# Llave primaria de cada archivo/entidad
+KEY_FIELDS = {
+    'hotels.json': 'hotel_id',
+    'customers.json': 'customer_id',
+    'reservations.json': 'reservation_id',
+}
+
+# Campos de cada entidad, en el orden en que se guardan como fila
+FIELDS = {
+    'hotels.json': ('hotel_id', 'name', 'location', 'rooms', 'version'),
+    'customers.json': ('customer_id', 'name', 'email', 'version'),
+    'reservations.json': ('reservation_id', 'customer_id', 'hotel_id',
+                          'check_in', 'check_out', 'version'),
+}
+
+# Valor de los campos ausentes en registros viejos (None por omisión)
+FIELD_DEFAULTS = {'version': 0}
+
+# Separadores de JSON sin espacios
+COMPACT = (',', ':')
+
+# Tipos que puede contener una fila del formato binario
+PRIMITIVES = {str, int, float, bool, type(None)}
+
+# Campos con índice secundario (llaves foráneas de la reservación)
+INDEXED_FIELDS = {
+    'hotels.json': (),
+    'customers.json': (),
+    'reservations.json': ('customer_id', 'hotel_id'),
+}
+
+
+def to_row(filename, record):
+    """Convierte un registro (dict) en una tupla en el orden de FIELDS."""
+    return tuple(record.get(f, FIELD_DEFAULTS.get(f))
+                 for f in FIELDS[filename])
+
+
+def from_row(filename, row):
+    """Convierte una fila en el registro (dict) que ve la aplicación."""
+    return dict(zip(FIELDS[filename], row))
+
+
+def dump_rows(filename, rows, file, binary=False):
+    """
+    Serializa filas en formato columnar: {"fields": [...], "rows": [...]}
+    como JSON compacto, o la tupla (campos, filas) con marshal si
+    `binary`. marshal solo reconstruye valores, no ejecuta código.
+    """
+    if binary:
+        marshal.dump((FIELDS[filename], [tuple(r) for r in rows]), file)
+    else:
+        json.dump({"fields": FIELDS[filename], "rows": list(rows)},
+                  file, separators=COMPACT)
+
+
+def _check_binary(data):
+    """
+    Verifica que lo leído con marshal sea (campos, filas) con solo
+    valores primitivos; cualquier otra cosa es un archivo inválido.
+    """
+    valid = (isinstance(data, tuple) and len(data) == 2
+             and isinstance(data[0], tuple) and isinstance(data[1], list)
+             and set(map(type, data[0])) <= {str}
+             and set(map(type, data[1])) <= {tuple}
+             and set(map(type, chain.from_iterable(data[1]))) <= PRIMITIVES)
+    if not valid:
+        raise ValueError("instantánea binaria inválida")
+    return data
+
+
+def load_rows(filename, file, binary=False):
+    """
+    Lee lo escrito por dump_rows (o una lista JSON de registros) y
+    devuelve las filas en el orden actual de FIELDS.
+    """
+    if binary:
+        try:
+            fields, rows = _check_binary(marshal.loads(file.read()))
+        except EOFError as error:
+            raise ValueError("instantánea binaria truncada") from error
+    else:
+        data = json.load(file)
+        if isinstance(data, list):
+            return [to_row(filename, r) for r in data]
+        fields, rows = data["fields"], data["rows"]
+    if tuple(fields) == FIELDS[filename]:
+        return [tuple(r) for r in rows]
+    return [to_row(filename, dict(zip(fields, r))) for r in rows]
+
+
+class StorageBackend:
+    """
+    Interfaz base de los motores de almacenamiento. `generation` cambia
+    cada vez que el motor detecta datos que no escribió este proceso
+    (otro proceso, o una transacción deshecha), para que los índices
+    derivados, como los calendarios, sepan que deben reconstruirse.
+    """
+
+    LOCK_FILE = '.hotel_system.lock'
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.generation = 0
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._lock_file = None
+
+    @contextmanager
+    def transaction(self):
+        """
+        Sección crítica reentrante. Serializa los hilos del proceso y,
+        en la transacción más externa, toma el candado del motor para
+        excluir a otros procesos.
+        """
+        with self._lock:
+            self._depth += 1
+            try:
+                if self._depth == 1:
+                    self._begin()
+                try:
+                    yield
+                except BaseException:
+                    if self._depth == 1:
+                        self._rollback()
+                        self.generation += 1
+                    raise
+                if self._depth == 1:
+                    self._commit()
+            finally:
+                self._depth -= 1
+
+    def _begin(self):
+        """Toma el candado de archivo compartido entre procesos."""
+        if fcntl is None or self.LOCK_FILE is None:
+            return
+        if self._lock_file is None:
+            self._lock_file = open(  # pylint: disable=R1732
+                self.get_filepath(self.LOCK_FILE), 'a', encoding='utf-8')
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+
+    def _commit(self):
+        """Libera el candado de archivo."""
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _rollback(self):
+        """Los motores de archivo no deshacen cambios: solo liberan."""
+        self._commit()
+
+    @staticmethod
+    def _stat(path):
+        """Identidad de un archivo para detectar reemplazos, o None."""
+        try:
+            info = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (info.st_ino, info.st_mtime_ns, info.st_size)
+
+    def get_filepath(self, filename):
+        """Devuelve la ruta absoluta de un archivo."""
+        return os.path.join(self.base_dir, filename)
+
+    def load_data(self, filename):
+        """Devuelve la lista completa de registros de una entidad."""
+        raise NotImplementedError
+
+    def save_data(self, filename, data):
+        """Reemplaza todos los registros de una entidad."""
+        raise NotImplementedError
+
+    def write(self, filename, changes):
+        """
+        Aplica una lista de cambios (llave, registro).
+        Un registro None elimina la llave; cualquier otro la inserta o
+        la reemplaza. Devuelve True si los cambios se persistieron.
+        """
+        raise NotImplementedError
+
+    def get(self, filename, key):
+        """Devuelve una copia del registro con la llave dada, o None."""
+        key_field = KEY_FIELDS[filename]
+        return next(
+            (r for r in self.load_data(filename) if r[key_field] == key),
+            None
+        )
+
+    def find(self, filename, field, value):
+        """Devuelve los registros cuyo campo `field` vale `value`."""
+        return [r for r in self.load_data(filename) if r.get(field) == value]
+
+    def close(self):
+        """Libera los recursos abiertos por el motor."""
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+class JsonBackend(StorageBackend):
+    """
+    Un archivo JSON completo por entidad, reescrito en cada cambio.
+    La reescritura va a un temporal que reemplaza al original, de modo
+    que un lector nunca ve un archivo a medio escribir. Se escribe sin
+    sangría salvo que se pida `indent` (p. ej. 4, el formato anterior).
+    """
+
+    def __init__(self, base_dir, indent=None):
+        super().__init__(base_dir)
+        self.indent = indent
+        self._seen = None
+
+    def _files(self):
+        """Identidad actual de los archivos de todas las entidades."""
+        return tuple(self._stat(self.get_filepath(name))
+                     for name in KEY_FIELDS)
+
+    def _begin(self):
+        """Toma el candado y detecta archivos reescritos por otros."""
+        super()._begin()
+        if self._files() != self._seen:
+            self.generation += 1
+
+    def _commit(self):
+        """Recuerda los archivos tal como quedaron y libera el candado."""
+        self._seen = self._files()
+        super()._commit()
+
+    def load_data(self, filename):
+        """Carga los datos de un archivo JSON."""
+        filepath = self.get_filepath(filename)
+        if not os.path.exists(filepath):
+            return []
+        try:
+            with open(filepath, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (json.JSONDecodeError, IOError):
+            print(f"Error: No se pudo leer '{filepath}'. "
+                  "Devolviendo lista vacía.")
+            return []
+
+    def save_data(self, filename, data):
+        """Guarda los datos en un archivo JSON."""
+        filepath = self.get_filepath(filename)
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        try:
+            with self.transaction():
+                with open(tmp_path, 'w', encoding='utf-8') as file:
+                    json.dump(data, file, indent=self.indent,
+                              separators=None if self.indent else COMPACT)
+                os.replace(tmp_path, filepath)
+        except IOError:
+            print(f"Error: No se pudo guardar en '{filepath}'.")
+            return False
+        return True
+
+    def write(self, filename, changes):
+        """Aplica los cambios sobre la lista y reescribe el archivo."""
+        key_field = KEY_FIELDS[filename]
+        with self.transaction():
+            data = self.load_data(filename)
+            positions = {r[key_field]: i for i, r in enumerate(data)}
+            for key, record in changes:
+                if key in positions:
+                    data[positions[key]] = record
+                elif record is not None:
+                    positions[key] = len(data)
+                    data.append(record)
+            data = [r for r in data if r is not None]
+            return self.save_data(filename, data)
+
+
+class MemoryBackend(StorageBackend):
+    """
+    Motor en memoria, sin archivos. Cada instancia es independiente, lo
+    que permite correr pruebas aisladas y en paralelo. Los registros se
+    guardan como tuplas en el orden de FIELDS; los campos de
+    INDEXED_FIELDS tienen un índice secundario {valor: {llave: None}}
+    que se construye en la primera búsqueda y se mantiene al escribir.
+    """
+
+    LOCK_FILE = None
+
+    def __init__(self, base_dir=''):
+        super().__init__(base_dir)
+        self._tables = {}
+        self._indexes = {}
+
+    def _table(self, filename):
+        """Devuelve el índice {llave: fila} de una entidad."""
+        return self._tables.setdefault(filename, {})
+
+    def _index(self, filename, position):
+        """Devuelve el índice secundario de una columna, construyéndolo."""
+        indexes = self._indexes.setdefault(filename, {})
+        if position not in indexes:
+            index = {}
+            for key, row in self._table(filename).items():
+                index.setdefault(row[position], {})[key] = None
+            indexes[position] = index
+        return indexes[position]
+
+    @staticmethod
+    def _to_rows(filename, changes):
+        """Convierte los cambios (llave, registro) en (llave, fila)."""
+        return [(key, to_row(filename, record) if record is not None
+                 else None) for key, record in changes]
+
+    def _apply(self, filename, rows):
+        """Aplica cambios (llave, fila o None) al índice en memoria."""
+        table = self._table(filename)
+        indexes = self._indexes.get(filename, {})
+        for key, row in rows:
+            old = table.pop(key, None) if row is None else table.get(key)
+            for position, index in indexes.items():
+                if old is not None:
+                    bucket = index[old[position]]
+                    del bucket[key]
+                    if not bucket:
+                        del index[old[position]]
+                if row is not None:
+                    index.setdefault(row[position], {})[key] = None
+            if row is not None:
+                table[key] = row
+
+    def load_data(self, filename):
+        """Devuelve copias de todos los registros de la entidad."""
+        with self.transaction():
+            return [from_row(filename, r)
+                    for r in self._table(filename).values()]
+
+    def get(self, filename, key):
+        """Busca un registro por llave en el índice en memoria."""
+        with self.transaction():
+            row = self._table(filename).get(key)
+            return from_row(filename, row) if row is not None else None
+
+    def find(self, filename, field, value):
+        """Filtra por índice secundario o recorriendo las filas."""
+        if field not in FIELDS[filename]:
+            return []
+        position = FIELDS[filename].index(field)
+        with self.transaction():
+            table = self._table(filename)
+            if field in INDEXED_FIELDS[filename]:
+                keys = self._index(filename, position).get(value, ())
+                return [from_row(filename, table[k]) for k in keys]
+            return [from_row(filename, r) for r in table.values()
+                    if r[position] == value]
+
+    def write(self, filename, changes):
+        """Aplica los cambios en memoria."""
+        with self.transaction():
+            self._apply(filename, self._to_rows(filename, changes))
+        return True
+
+    def save_data(self, filename, data):
+        """Reemplaza todos los registros de la entidad."""
+        key_field = KEY_FIELDS[filename]
+        with self.transaction():
+            self._tables[filename] = {
+                r[key_field]: to_row(filename, r) for r in data}
+            self._indexes.pop(filename, None)
+        return True
+
+
+class LogBackend(MemoryBackend):  # pylint: disable=R0902
+    """
+    Motor de bitácora de solo escritura al final (write-ahead log).
+
+    Cada cambio agrega una línea compacta [llave, fila] a '<entidad>.wal'.
+    Al acumular `compact_every` líneas se escribe una instantánea
+    columnar '<entidad>.snapshot.json' ('.snapshot.bin' con
+    `binary=True`) y se vacía la bitácora. En memoria cada registro es
+    una tupla en el orden de FIELDS, no un diccionario. Al
+    arrancar se carga la instantánea y se reproduce la cola de la
+    bitácora; una última línea truncada por una caída se descarta.
+    Como cada línea guarda el registro completo, reproducirla dos veces
+    es inofensivo.
+
+    Varios procesos pueden compartir el directorio: al iniciar cada
+    transacción se leen las líneas que otros agregaron y, si alguien
+    compactó, se recarga la instantánea.
+    """
+
+    LOCK_FILE = StorageBackend.LOCK_FILE
+
+    def __init__(self, base_dir, compact_every=1000, fsync=False,
+                 binary=False):
+        super().__init__(base_dir)
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.binary = binary
+        self._pending = {}
+        self._offsets = {}
+        self._snapshots = {}
+        self._logs = {}
+
+    def _paths(self, filename):
+        """Devuelve las rutas (instantánea, bitácora) de una entidad."""
+        stem = os.path.splitext(filename)[0]
+        extension = 'bin' if self.binary else 'json'
+        return (self.get_filepath(f"{stem}.snapshot.{extension}"),
+                self.get_filepath(f"{stem}.wal"))
+
+    def _begin(self):
+        """Toma el candado y sincroniza con lo escrito por otros."""
+        super()._begin()
+        for filename in list(self._tables):
+            snapshot_path, log_path = self._paths(filename)
+            log_size = os.path.getsize(log_path) \
+                if os.path.exists(log_path) else 0
+            if (self._stat(snapshot_path) != self._snapshots[filename]
+                    or log_size < self._offsets[filename]):
+                self._tables[filename] = self._recover(filename)
+                self._indexes.pop(filename, None)
+                self.generation += 1
+            elif log_size > self._offsets[filename]:
+                self._replay(filename, self._tables[filename])
+                self._indexes.pop(filename, None)
+                self.generation += 1
+
+    def _table(self, filename):
+        """Devuelve el índice en memoria de una entidad, cargándolo."""
+        if filename not in self._tables:
+            self._tables[filename] = self._recover(filename)
+        return self._tables[filename]
+
+    def _recover(self, filename):
+        """Reconstruye el estado: instantánea + cola de la bitácora."""
+        key_field = KEY_FIELDS[filename]
+        snapshot_path = self._paths(filename)[0]
+        key_index = FIELDS[filename].index(key_field)
+        table = {}
+        legacy = False
+        if os.path.exists(snapshot_path):
+            mode = 'rb' if self.binary else 'r'
+            encoding = None if self.binary else 'utf-8'
+            with open(snapshot_path, mode, encoding=encoding) as file:
+                for row in load_rows(filename, file, self.binary):
+                    table[row[key_index]] = row
+        elif os.path.exists(self.get_filepath(filename)):
+            # Sin instantánea: el archivo JSON tradicional es la base y la
+            # bitácora, si existe, se escribió encima de él
+            legacy = True
+            for record in JsonBackend(self.base_dir).load_data(filename):
+                table[record[key_field]] = to_row(filename, record)
+
+        self._snapshots[filename] = self._stat(snapshot_path)
+        self._pending[filename] = 0
+        self._offsets[filename] = 0
+        self._replay(filename, table)
+        if legacy:
+            # Fijar la importación en una instantánea para que los
+            # siguientes arranques ya no dependan del archivo JSON
+            self._tables[filename] = table
+            self.compact(filename)
+        return table
+
+    def _replay(self, filename, table):
+        """Aplica las líneas de la bitácora desde el último desplazamiento."""
+        log_path = self._paths(filename)[1]
+        if not os.path.exists(log_path):
+            return
+        offset = self._offsets[filename]
+        with open(log_path, 'rb') as file:
+            file.seek(offset)
+            for line in file:
+                try:
+                    key, record = json.loads(line)
+                except ValueError:
+                    # Escritura incompleta: se descarta desde aquí
+                    break
+                if record is None:
+                    table.pop(key, None)
+                elif isinstance(record, dict):
+                    table[key] = to_row(filename, record)
+                else:
+                    table[key] = tuple(record)
+                offset += len(line)
+                self._pending[filename] += 1
+        if offset < os.path.getsize(log_path):
+            print(f"Aviso: Se descartó una escritura incompleta "
+                  f"en '{log_path}'.")
+            with open(log_path, 'r+b') as file:
+                file.truncate(offset)
+        self._offsets[filename] = offset
+
+    def _log(self, filename):
+        """Devuelve el archivo de bitácora abierto para agregar."""
+        if filename not in self._logs:
+            log_path = self._paths(filename)[1]
+            self._logs[filename] = open(  # pylint: disable=R1732
+                log_path, 'ab')
+        return self._logs[filename]
+
+    def write(self, filename, changes):
+        """Agrega los cambios a la bitácora y los aplica en memoria."""
+        rows = self._to_rows(filename, changes)
+        lines = "".join(
+            json.dumps([key, row], separators=COMPACT) + "\n"
+            for key, row in rows
+        ).encode('utf-8')
+        with self.transaction():
+            self._table(filename)
+            try:
+                log = self._log(filename)
+                log.write(lines)
+                log.flush()
+                if self.fsync:
+                    os.fsync(log.fileno())
+            except IOError:
+                print(f"Error: No se pudo escribir la bitácora de "
+                      f"'{filename}'.")
+                return False
+
+            self._apply(filename, rows)
+            self._offsets[filename] += len(lines)
+            self._pending[filename] += len(changes)
+            if self._pending[filename] >= self.compact_every:
+                self.compact(filename)
+        return True
+
+    def save_data(self, filename, data):
+        """Reemplaza la entidad completa con una nueva instantánea."""
+        with self.transaction():
+            self._table(filename)
+            super().save_data(filename, data)
+            return self.compact(filename)
+
+    def compact(self, filename):
+        """Escribe la instantánea de forma atómica y vacía la bitácora."""
+        snapshot_path, log_path = self._paths(filename)
+        tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with self.transaction():
+            rows = self._table(filename).values()
+            try:
+                mode = 'wb' if self.binary else 'w'
+                encoding = None if self.binary else 'utf-8'
+                with open(tmp_path, mode, encoding=encoding) as file:
+                    dump_rows(filename, rows, file, self.binary)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(tmp_path, snapshot_path)
+                if filename in self._logs:
+                    self._logs.pop(filename).close()
+                with open(log_path, 'wb'):
+                    pass
+            except IOError:
+                print(f"Error: No se pudo compactar '{filename}'.")
+                return False
+            self._snapshots[filename] = self._stat(snapshot_path)
+            self._offsets[filename] = 0
+            self._pending[filename] = 0
+        return True
+
+    def import_json(self, filename, path=None):
+        """Carga un archivo JSON tradicional como nuevo contenido."""
+        path = path or self.get_filepath(filename)
+        data = JsonBackend(os.path.dirname(path)).load_data(
+            os.path.basename(path))
+        return self.save_data(filename, data)
+
+    def export_json(self, filename, path=None):
+        """Exporta la entidad al formato JSON tradicional."""
+        path = path or self.get_filepath(filename)
+        return JsonBackend(os.path.dirname(path)).save_data(
+            os.path.basename(path), self.load_data(filename))
+
+    def close(self):
+        """Cierra los archivos de bitácora abiertos."""
+        for log in self._logs.values():
+            log.close()
+        self._logs.clear()
+        super().close()
+
+
+class SqliteBackend(StorageBackend):
+    """
+    Motor sobre sqlite3: una tabla por entidad con la llave primaria
+    indexada, índices sobre reservations.hotel_id/customer_id y el
+    diario en modo WAL. El registro completo se guarda como JSON en la
+    columna `data`. Las transacciones usan BEGIN IMMEDIATE, que excluye
+    a otros escritores (hilos o procesos) hasta el COMMIT.
+    """
+
+    def __init__(self, base_dir, db_name='hotel_system.db'):
+        super().__init__(base_dir)
+        self.conn = sqlite3.connect(
+            self.get_filepath(db_name), timeout=60,
+            isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._data_version = None
+        with self.transaction():
+            for filename, key_field in KEY_FIELDS.items():
+                table = self._table_name(filename)
+                columns = "".join(
+                    f", {field}" for field in INDEXED_FIELDS[filename])
+                self.conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} "
+                    f"({key_field} PRIMARY KEY{columns}, data TEXT NOT NULL)")
+                for field in INDEXED_FIELDS[filename]:
+                    self.conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{table}_{field} "
+                        f"ON {table} ({field})")
+
+    def _begin(self):
+        """
+        Inicia una transacción de escritura en SQLite. PRAGMA
+        data_version cambia cuando otra conexión confirmó cambios.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._data_version = version
+            self.generation += 1
+
+    def _commit(self):
+        """Confirma la transacción."""
+        self.conn.execute("COMMIT")
+
+    def _rollback(self):
+        """Descarta la transacción."""
+        self.conn.execute("ROLLBACK")
+
+    @staticmethod
+    def _table_name(filename):
+        """Nombre de la tabla para un archivo: 'hotels.json' -> hotels."""
+        return os.path.splitext(filename)[0]
+
+    def _row(self, filename, key, record):
+        """Convierte un registro en la tupla de parámetros del INSERT."""
+        indexed = tuple(record.get(f) for f in INDEXED_FIELDS[filename])
+        return (key,) + indexed + (json.dumps(record, separators=COMPACT),)
+
+    def _insert_sql(self, filename):
+        """Sentencia INSERT OR REPLACE para la tabla de la entidad."""
+        placeholders = ", ".join("?" * (len(INDEXED_FIELDS[filename]) + 2))
+        return (f"INSERT OR REPLACE INTO {self._table_name(filename)} "
+                f"VALUES ({placeholders})")
+
+    def load_data(self, filename):
+        """Devuelve todos los registros en orden de inserción."""
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT data FROM {self._table_name(filename)} "
+                "ORDER BY rowid").fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def get(self, filename, key):
+        """Busca un registro por su llave primaria."""
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT data FROM {self._table_name(filename)} "
+                f"WHERE {KEY_FIELDS[filename]} = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, filename, field, value):
+        """Consulta por campo; usa el índice si el campo lo tiene."""
+        table = self._table_name(filename)
+        if field in INDEXED_FIELDS[filename] or field == KEY_FIELDS[filename]:
+            column, params = field, (value,)
+        else:
+            column, params = "json_extract(data, ?)", (f"$.{field}", value)
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT data FROM {table} WHERE {column} = ? "
+                "ORDER BY rowid", params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def save_data(self, filename, data):
+        """Reemplaza el contenido de la tabla en una sola transacción."""
+        key_field = KEY_FIELDS[filename]
+        try:
+            with self.transaction():
+                self.conn.execute(f"DELETE FROM {self._table_name(filename)}")
+                self.conn.executemany(
+                    self._insert_sql(filename),
+                    [self._row(filename, r[key_field], r) for r in data])
+        except sqlite3.Error:
+            print(f"Error: No se pudo guardar '{filename}' en SQLite.")
+            return False
+        return True
+
+    def write(self, filename, changes):
+        """Aplica los cambios en una sola transacción."""
+        delete_sql = (f"DELETE FROM {self._table_name(filename)} "
+                      f"WHERE {KEY_FIELDS[filename]} = ?")
+        try:
+            with self.transaction():
+                for key, record in changes:
+                    if record is None:
+                        self.conn.execute(delete_sql, (key,))
+                    else:
+                        self.conn.execute(self._insert_sql(filename),
+                                          self._row(filename, key, record))
+        except sqlite3.Error:
+            print(f"Error: No se pudo escribir '{filename}' en SQLite.")
+            return False
+        return True
+
+    def close(self):
+        """Cierra la conexión a la base de datos."""
+        self.conn.close()
+        super().close()
+
+
+# Motores disponibles por nombre (ver make_backend)
+BACKENDS = {
+    'json': JsonBackend,
+    'log': LogBackend,
+    'sqlite': SqliteBackend,
+    'memory': MemoryBackend,
+}
+
+
+def make_backend(name, base_dir):
+    """Crea el motor `name` ('json', 'log', 'sqlite' o 'memory')."""
+    if name not in BACKENDS:
+        raise ValueError(f"Motor desconocido: '{name}'. "
+                         f"Opciones: {', '.join(sorted(BACKENDS))}")
+    return BACKENDS[name](base_dir)
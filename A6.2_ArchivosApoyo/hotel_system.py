@@ -1,89 +1,279 @@
 """
 Sistema para gestionar Hoteles, Clientes y Reservaciones.
-Persiste los datos en archivos JSON en un directorio específico.
+Persiste los datos en archivos JSON en un directorio específico, o en
+una bitácora de solo escritura al final, en SQLite o solo en memoria
+(ver hotel_storage).
+
+El directorio de datos se toma de la variable de entorno HOTEL_SYSTEM_DIR
+(por defecto, el directorio de este módulo) y el motor de
+HOTEL_SYSTEM_BACKEND ('json' por defecto).
 """
 
 import os
-import json
+
+from hotel_calendar import CalendarCache, parse_stay, to_date
+from hotel_storage import (
+    BACKENDS, FIELDS, KEY_FIELDS, JsonBackend, LogBackend, MemoryBackend,
+    SqliteBackend, make_backend
+)
+
+# Los motores se reexportan para quien importa solo hotel_system
+__all__ = [
+    'BACKENDS', 'FIELDS', 'KEY_FIELDS', 'JsonBackend', 'LogBackend',
+    'MemoryBackend', 'SqliteBackend', 'make_backend', 'BASE_DIR',
+    'FileManager', 'Record', 'Hotel', 'Customer', 'Reservation',
+]
 
 # Definir ruta base
-BASE_DIR = '/content/drive/MyDrive/PruebasSoftware2026/A6.2_ArchivosApoyo'
+BASE_DIR = os.environ.get('HOTEL_SYSTEM_DIR',
+                          os.path.dirname(os.path.abspath(__file__)))
+
+# Reintentos ante un conflicto de versión (control optimista)
+MAX_RETRIES = 50
+
+# Calendarios de ocupación por hotel (reservaciones con fechas)
+CALENDARS = CalendarCache()
 
 
 class FileManager:
-    """Clase auxiliar para manejar operaciones de archivos."""
+    """
+    Fachada de persistencia. Delega en un motor de almacenamiento
+    intercambiable (JSON completo por defecto, LogBackend, SqliteBackend
+    o MemoryBackend).
+    """
+    backend = make_backend(os.environ.get('HOTEL_SYSTEM_BACKEND', 'json'),
+                           BASE_DIR)
 
-    @staticmethod
-    def get_filepath(filename):
+    @classmethod
+    def set_backend(cls, backend):
+        """
+        Reemplaza el motor de almacenamiento activo y devuelve el anterior,
+        sin cerrarlo, para que quien lo cambió pueda restaurarlo.
+        """
+        previous, cls.backend = cls.backend, backend
+        CALENDARS.clear()
+        return previous
+
+    @classmethod
+    def get_filepath(cls, filename):
         """Devuelve la ruta absoluta de un archivo."""
-        return os.path.join(BASE_DIR, filename)
+        return cls.backend.get_filepath(filename)
 
-    @staticmethod
-    def load_data(filename):
-        """Carga los datos de un archivo JSON."""
-        filepath = FileManager.get_filepath(filename)
-        if not os.path.exists(filepath):
-            return []
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except (json.JSONDecodeError, IOError):
-            print(f"Error: No se pudo leer '{filepath}'. Devolviendo lista vacía.")
-            return []
+    @classmethod
+    def load_data(cls, filename):
+        """Carga todos los registros de un archivo."""
+        return cls.backend.load_data(filename)
+
+    @classmethod
+    def save_data(cls, filename, data):
+        """Reemplaza todos los registros de un archivo."""
+        CALENDARS.clear()
+        return cls.backend.save_data(filename, data)
+
+    @classmethod
+    def get(cls, filename, key):
+        """Devuelve el registro con la llave dada, o None."""
+        return cls.backend.get(filename, key)
+
+    @classmethod
+    def find(cls, filename, field, value):
+        """Devuelve los registros cuyo campo `field` vale `value`."""
+        return cls.backend.find(filename, field, value)
+
+    @classmethod
+    def write(cls, filename, changes):
+        """Persiste una lista de cambios (llave, registro o None)."""
+        return cls.backend.write(filename, changes)
+
+    @classmethod
+    def transaction(cls):
+        """Sección atómica del motor activo (candado o BEGIN IMMEDIATE)."""
+        return cls.backend.transaction()
+
+    @classmethod
+    def write_if_version(cls, filename, key, record):
+        """
+        Control optimista: escribe `record` solo si el almacenado
+        conserva la versión con la que se leyó, e incrementa la versión.
+        Devuelve False si otro escritor lo modificó entretanto.
+        """
+        expected = record.get('version', 0)
+        with cls.backend.transaction():
+            current = cls.backend.get(filename, key)
+            if current is None or current.get('version', 0) != expected:
+                return False
+            record = dict(record, version=expected + 1)
+            return cls.backend.write(filename, [(key, record)])
 
-    @staticmethod
-    def save_data(filename, data):
-        """Guarda los datos en un archivo JSON."""
-        filepath = FileManager.get_filepath(filename)
-        try:
-            with open(filepath, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=4)
-        except IOError:
-            print(f"Error: No se pudo guardar en '{filepath}'.")
 
+class Record:
+    """
+    Base de las entidades: cada subclase declara `__slots__` con los
+    campos de FIELDS, de modo que una instancia no carga un __dict__.
+    """
+    __slots__ = ()
+    FILE = None
+    # Campos que solo modifica el sistema (control de versiones)
+    READ_ONLY = ('version',)
 
-class Hotel:
+    def to_dict(self):
+        """Devuelve la representación en diccionario de la entidad."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Construye la entidad a partir de un registro almacenado."""
+        return cls(**{f: data[f] for f in cls.__slots__ if f in data})
+
+    @classmethod
+    def check_fields(cls, changes):
+        """Valida que `changes` solo toque campos modificables."""
+        unknown = sorted(set(changes) - set(cls.__slots__))
+        if unknown:
+            print(f"Error: Campos desconocidos: {', '.join(unknown)}.")
+            return False
+        read_only = sorted(set(changes) & set(cls.READ_ONLY))
+        if read_only:
+            print(f"Error: Campos de solo lectura: {', '.join(read_only)}.")
+            return False
+        return True
+
+
+def _update_record(entity, key, changes):
+    """
+    Aplica `changes` al registro `key` e incrementa su versión, para que
+    las escrituras optimistas basadas en una lectura anterior fallen.
+    Devuelve el registro, None si no existe o False si no se guardó.
+    """
+    filename = entity.FILE
+    with FileManager.transaction():
+        current = FileManager.get(filename, key)
+        if current is None:
+            return None
+        record = entity.from_dict(current)
+        for field, value in changes.items():
+            setattr(record, field, value)
+        record.version = current.get('version', 0) + 1
+        record = record.to_dict()
+        return record if FileManager.write(filename, [(key, record)]) \
+            else False
+
+
+def _write_hotels(hotels):
+    """Persiste en una escritura los hoteles modificados por un lote."""
+    if not hotels:
+        return True
+    return FileManager.write(Hotel.FILE, [
+        (key, dict(hotel, version=hotel.get('version', 0) + 1))
+        for key, hotel in hotels.items()
+    ])
+
+
+def _write_batch(filename, changes, undo, hotels):
+    """
+    Persiste los cambios de un lote y después los hoteles modificados.
+    Si falla la segunda escritura se aplica `undo` a la primera.
+    Devuelve True si ambas se guardaron.
+    """
+    if changes and not FileManager.write(filename, changes):
+        return False
+    if not _write_hotels(hotels):
+        FileManager.write(filename, undo)
+        return False
+    return True
+
+
+def _mark_unsaved(accepted, failed):
+    """Pasa a `failed` lo aceptado en un lote que no se pudo guardar."""
+    failed.extend((index, key, "no se pudo guardar")
+                  for key, (index, _) in accepted.items())
+    accepted.clear()
+
+
+def _batch_report(label, ok, failed):
+    """Imprime el resumen de un lote y devuelve el reporte."""
+    print(f"Lote de {label}: {len(ok)} aplicados, {len(failed)} fallidos.")
+    return {"ok": ok, "failed": failed}
+
+
+def _create_batch(cls, items, label):
+    """
+    Crea en lote las entidades de `cls` a partir de diccionarios con los
+    argumentos del constructor. Valida contra un índice en memoria y
+    persiste una sola vez; cada fallo se reporta como
+    (posición, llave, motivo) sin abortar el resto del lote.
+    """
+    key_field = KEY_FIELDS[cls.FILE]
+    failed, accepted = [], {}
+    with FileManager.transaction():
+        existing = {r[key_field] for r in FileManager.load_data(cls.FILE)}
+        for index, item in enumerate(items):
+            key = item.get(key_field) if isinstance(item, dict) else None
+            try:
+                record = cls(**item).to_dict()
+            except TypeError:
+                failed.append((index, key, "registro inválido"))
+                continue
+            if key in existing or key in accepted:
+                failed.append((index, key, "ID duplicado"))
+                continue
+            accepted[key] = (index, record)
+        if accepted and not FileManager.write(cls.FILE, [
+                (key, record) for key, (_, record) in accepted.items()]):
+            _mark_unsaved(accepted, failed)
+    return _batch_report(label, list(accepted), failed)
+
+
+class Hotel(Record):
     """Clase para gestionar las entidades de Hotel."""
     FILE = 'hotels.json'
+    __slots__ = FIELDS[FILE]
 
-    def __init__(self, hotel_id, name, location, rooms):
+    def __init__(self, hotel_id, name, location, rooms, version=0):
+        # pylint: disable=too-many-arguments
         self.hotel_id = hotel_id
         self.name = name
         self.location = location
         self.rooms = rooms
-
-    def to_dict(self):
-        """Devuelve la representación en diccionario del hotel."""
-        return self.__dict__
+        self.version = version
 
     @classmethod
     def create_hotel(cls, hotel_id, name, location, rooms):
         """Crea un nuevo hotel y lo guarda en el archivo."""
-        hotels = FileManager.load_data(cls.FILE)
-        if any(h['hotel_id'] == hotel_id for h in hotels):
-            print(f"Error: El ID del hotel {hotel_id} ya existe.")
-            return
         new_hotel = cls(hotel_id, name, location, rooms)
-        hotels.append(new_hotel.to_dict())
-        FileManager.save_data(cls.FILE, hotels)
+        # Revisar y escribir en una transacción: dos altas del mismo ID
+        # no deben pisarse
+        with FileManager.transaction():
+            if FileManager.get(cls.FILE, hotel_id) is not None:
+                print(f"Error: El ID del hotel {hotel_id} ya existe.")
+                return False
+            if not FileManager.write(cls.FILE,
+                                     [(hotel_id, new_hotel.to_dict())]):
+                return False
         print(f"Hotel '{name}' creado exitosamente.")
+        return True
+
+    @classmethod
+    def create_hotels(cls, hotels):
+        """Crea hoteles en lote; ver _create_batch."""
+        return _create_batch(cls, hotels, "hoteles")
 
     @classmethod
     def delete_hotel(cls, hotel_id):
         """Elimina un hotel por su ID."""
-        hotels = FileManager.load_data(cls.FILE)
-        new_list = [h for h in hotels if h['hotel_id'] != hotel_id]
-        if len(hotels) == len(new_list):
+        if FileManager.get(cls.FILE, hotel_id) is None:
             print(f"Error: ID del hotel {hotel_id} no encontrado.")
-        else:
-            FileManager.save_data(cls.FILE, new_list)
-            print(f"ID del hotel {hotel_id} eliminado.")
+            return False
+        if not FileManager.write(cls.FILE, [(hotel_id, None)]):
+            return False
+        CALENDARS.discard(hotel_id)
+        print(f"ID del hotel {hotel_id} eliminado.")
+        return True
 
     @classmethod
     def display_hotel_info(cls, hotel_id):
         """Muestra la información de un hotel específico."""
-        hotels = FileManager.load_data(cls.FILE)
-        hotel = next((h for h in hotels if h['hotel_id'] == hotel_id), None)
+        hotel = FileManager.get(cls.FILE, hotel_id)
         if hotel:
             print(f"Información del Hotel: {hotel}")
             return hotel
@@ -93,91 +283,144 @@ class Hotel:
     @classmethod
     def modify_hotel_info(cls, hotel_id, **kwargs):
         """Modifica los atributos de un hotel existente."""
-        hotels = FileManager.load_data(cls.FILE)
-        found = False
-        for hotel in hotels:
-            if hotel['hotel_id'] == hotel_id:
-                hotel.update(kwargs)
-                found = True
-                break
-
-        if found:
-            FileManager.save_data(cls.FILE, hotels)
-            print(f"ID del hotel {hotel_id} actualizado.")
-        else:
+        if not cls.check_fields(kwargs):
+            return False
+        record = _update_record(cls, hotel_id, kwargs)
+        if record is None:
             print(f"Error: ID del hotel {hotel_id} no encontrado.")
+            return False
+        if record is False:
+            return False
+        CALENDARS.discard(hotel_id)
+        print(f"ID del hotel {hotel_id} actualizado.")
+        return True
+
+    @classmethod
+    def calendar(cls, hotel_id):
+        """
+        Calendario de ocupación del hotel (ver hotel_calendar). Se
+        revalida dentro de la transacción: si el motor detectó cambios
+        de otro proceso o deshizo una transacción, se reconstruye.
+        Quien lo use debe hacerlo dentro de la misma transacción.
+        """
+        with FileManager.transaction():
+            CALENDARS.sync(FileManager.backend.generation)
+            return CALENDARS.get(hotel_id, Reservation.list_by_hotel)
+
+    @classmethod
+    def is_available(cls, hotel_id, check_in, check_out):
+        """Indica si queda una habitación libre todas las noches del rango."""
+        try:
+            stay = parse_stay(check_in, check_out)
+        except (TypeError, ValueError):
+            print(f"Error: Fechas inválidas ({check_in}, {check_out}).")
+            return False
+        with FileManager.transaction():
+            hotel = FileManager.get(cls.FILE, hotel_id)
+            if hotel is None:
+                print(f"Error: ID del hotel {hotel_id} no encontrado.")
+                return False
+            return (cls.calendar(hotel_id).max_occupancy(*stay)
+                    < hotel['rooms'])
+
+    @classmethod
+    def occupancy_by_day(cls, hotel_id, start, end):
+        """
+        Habitaciones ocupadas por noche: {'AAAA-MM-DD': ocupadas}, o None
+        si el hotel no existe o el rango no es válido.
+        """
+        try:
+            start, end = to_date(start), to_date(end)
+        except (TypeError, ValueError):
+            print(f"Error: Fechas inválidas ({start}, {end}).")
+            return None
+        with FileManager.transaction():
+            if FileManager.get(cls.FILE, hotel_id) is None:
+                print(f"Error: ID del hotel {hotel_id} no encontrado.")
+                return None
+            return {
+                day.isoformat(): count
+                for day, count in cls.calendar(hotel_id).occupancy_range(
+                    start, end)
+            }
 
     @classmethod
     def reserve_room(cls, hotel_id):
         """Decrementa las habitaciones disponibles de un hotel."""
-        hotels = FileManager.load_data(cls.FILE)
-        for hotel in hotels:
-            if hotel['hotel_id'] == hotel_id:
-                if hotel['rooms'] > 0:
-                    hotel['rooms'] -= 1
-                    FileManager.save_data(cls.FILE, hotels)
-                    return True
-                print(f"Error: No hay habitaciones disponibles en el Hotel {hotel_id}.")
+        for _ in range(MAX_RETRIES):
+            hotel = FileManager.get(cls.FILE, hotel_id)
+            if hotel is None:
+                print(f"Error: ID del hotel {hotel_id} no encontrado.")
                 return False
-        print(f"Error: ID del hotel {hotel_id} no encontrado.")
+            if hotel['rooms'] <= 0:
+                print(f"Error: No hay habitaciones disponibles "
+                      f"en el Hotel {hotel_id}.")
+                return False
+            hotel['rooms'] -= 1
+            if FileManager.write_if_version(cls.FILE, hotel_id, hotel):
+                return True
+        print(f"Error: Conflicto concurrente al reservar en {hotel_id}.")
         return False
 
     @classmethod
     def cancel_reservation(cls, hotel_id):
         """Incrementa las habitaciones disponibles de un hotel."""
-        hotels = FileManager.load_data(cls.FILE)
-        for hotel in hotels:
-            if hotel['hotel_id'] == hotel_id:
-                hotel['rooms'] += 1
-                FileManager.save_data(cls.FILE, hotels)
+        for _ in range(MAX_RETRIES):
+            hotel = FileManager.get(cls.FILE, hotel_id)
+            if hotel is None:
+                print(f"Error: ID del hotel {hotel_id} no encontrado.")
                 return
-        print(f"Error: ID del hotel {hotel_id} no encontrado.")
+            hotel['rooms'] += 1
+            if FileManager.write_if_version(cls.FILE, hotel_id, hotel):
+                return
+        print(f"Error: Conflicto concurrente al liberar en {hotel_id}.")
 
 
-class Customer:
+class Customer(Record):
     """Clase para gestionar las entidades de Cliente."""
     FILE = 'customers.json'
+    __slots__ = FIELDS[FILE]
 
-    def __init__(self, customer_id, name, email):
+    def __init__(self, customer_id, name, email, version=0):
         self.customer_id = customer_id
         self.name = name
         self.email = email
-
-    def to_dict(self):
-        """Devuelve la representación en diccionario del cliente."""
-        return self.__dict__
+        self.version = version
 
     @classmethod
     def create_customer(cls, customer_id, name, email):
         """Crea un nuevo cliente."""
-        customers = FileManager.load_data(cls.FILE)
-        if any(c['customer_id'] == customer_id for c in customers):
-            print(f"Error: El ID del cliente {customer_id} ya existe.")
-            return
         new_cust = cls(customer_id, name, email)
-        customers.append(new_cust.to_dict())
-        FileManager.save_data(cls.FILE, customers)
+        with FileManager.transaction():
+            if FileManager.get(cls.FILE, customer_id) is not None:
+                print(f"Error: El ID del cliente {customer_id} ya existe.")
+                return False
+            if not FileManager.write(cls.FILE,
+                                     [(customer_id, new_cust.to_dict())]):
+                return False
         print(f"Cliente '{name}' creado exitosamente.")
+        return True
+
+    @classmethod
+    def create_customers(cls, customers):
+        """Crea clientes en lote; ver _create_batch."""
+        return _create_batch(cls, customers, "clientes")
 
     @classmethod
     def delete_customer(cls, customer_id):
         """Elimina un cliente."""
-        customers = FileManager.load_data(cls.FILE)
-        new_list = [c for c in customers if c['customer_id'] != customer_id]
-        if len(customers) == len(new_list):
+        if FileManager.get(cls.FILE, customer_id) is None:
             print(f"Error: ID del cliente {customer_id} no encontrado.")
-        else:
-            FileManager.save_data(cls.FILE, new_list)
-            print(f"ID del cliente {customer_id} eliminado.")
+            return False
+        if not FileManager.write(cls.FILE, [(customer_id, None)]):
+            return False
+        print(f"ID del cliente {customer_id} eliminado.")
+        return True
 
     @classmethod
     def display_customer_info(cls, customer_id):
         """Muestra la información del cliente."""
-        customers = FileManager.load_data(cls.FILE)
-        cust = next(
-            (c for c in customers if c['customer_id'] == customer_id),
-            None
-        )
+        cust = FileManager.get(cls.FILE, customer_id)
         if cust:
             print(f"Información del Cliente: {cust}")
             return cust
@@ -187,73 +430,232 @@ class Customer:
     @classmethod
     def modify_customer_info(cls, customer_id, **kwargs):
         """Modifica la información del cliente."""
-        customers = FileManager.load_data(cls.FILE)
-        found = False
-        for cust in customers:
-            if cust['customer_id'] == customer_id:
-                cust.update(kwargs)
-                found = True
-                break
-
-        if found:
-            FileManager.save_data(cls.FILE, customers)
-            print(f"ID del cliente {customer_id} actualizado.")
-        else:
+        if not cls.check_fields(kwargs):
+            return False
+        record = _update_record(cls, customer_id, kwargs)
+        if record is None:
             print(f"Error: ID del cliente {customer_id} no encontrado.")
+            return False
+        if record is False:
+            return False
+        print(f"ID del cliente {customer_id} actualizado.")
+        return True
 
 
-class Reservation:
+class Reservation(Record):
     """Clase para gestionar las Reservaciones."""
     FILE = 'reservations.json'
+    __slots__ = FIELDS[FILE]
 
-    def __init__(self, reservation_id, customer_id, hotel_id):
+    def __init__(self, reservation_id, customer_id, hotel_id,
+                 check_in=None, check_out=None, version=0):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
         self.reservation_id = reservation_id
         self.customer_id = customer_id
         self.hotel_id = hotel_id
+        self.check_in = check_in
+        self.check_out = check_out
+        self.version = version
 
-    def to_dict(self):
-        """Devuelve la representación en diccionario de la reservación."""
-        return self.__dict__
-
-    @classmethod
-    def create_reservation(cls, reservation_id, customer_id, hotel_id):
-        """Crea una reservación si el hotel y el cliente existen."""
-        # Verificar que el cliente existe
-        cust = Customer.display_customer_info(customer_id)
-        if not cust:
-            print("Fallo en la reservación: Cliente no encontrado.")
-            return
-
-        # Verificar que el hotel existe y reservar habitación
-        if not Hotel.reserve_room(hotel_id):
-            print("Fallo en la reservación: Hotel no encontrado o sin habitaciones.")
-            return
-
-        reservations = FileManager.load_data(cls.FILE)
-        new_res = cls(reservation_id, customer_id, hotel_id)
-        reservations.append(new_res.to_dict())
-        FileManager.save_data(cls.FILE, reservations)
+    @staticmethod
+    def _is_dated(record):
+        """Indica si la reservación trae fechas de estancia."""
+        return (record.get('check_in') is not None
+                or record.get('check_out') is not None)
+
+    @classmethod
+    def _check_stay(cls, hotel, record):
+        """
+        Valida la estancia contra el calendario del hotel, sin apartarla:
+        se agrega al calendario solo cuando la reservación se guarda.
+        Devuelve (motivo del rechazo o None, estancia).
+        """
+        try:
+            stay = parse_stay(record['check_in'], record['check_out'])
+        except (TypeError, ValueError):
+            return "fechas inválidas", None
+        calendar = Hotel.calendar(hotel['hotel_id'])
+        if calendar.max_occupancy(*stay) >= hotel['rooms']:
+            return "sin disponibilidad en las fechas", None
+        return None, stay
+
+    @classmethod
+    def create_reservation(cls, reservation_id, customer_id, hotel_id,
+                           check_in=None, check_out=None):
+        """
+        Crea una reservación si el hotel y el cliente existen.
+        Sin fechas ocupa una habitación del inventario; con fechas
+        ('AAAA-MM-DD', salida exclusiva) se valida contra el calendario.
+        Todo el proceso ocurre en una sola transacción del motor.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        with FileManager.transaction():
+            if FileManager.get(cls.FILE, reservation_id) is not None:
+                print(f"Error: La reservación {reservation_id} ya existe.")
+                return False
+
+            # Verificar que el cliente existe
+            cust = Customer.display_customer_info(customer_id)
+            if not cust:
+                print("Fallo en la reservación: Cliente no encontrado.")
+                return False
+
+            new_res = cls(reservation_id, customer_id, hotel_id,
+                          check_in, check_out)
+            stay = None
+            if cls._is_dated(new_res.to_dict()):
+                hotel = Hotel.display_hotel_info(hotel_id)
+                reason, stay = cls._check_stay(hotel, new_res.to_dict()) \
+                    if hotel else ("hotel no encontrado", None)
+                if reason:
+                    print(f"Fallo en la reservación: {reason}.")
+                    return False
+            # Verificar que el hotel existe y reservar habitación
+            elif not Hotel.reserve_room(hotel_id):
+                print("Fallo en la reservación: "
+                      "Hotel no encontrado o sin habitaciones.")
+                return False
+
+            if not FileManager.write(
+                    cls.FILE, [(reservation_id, new_res.to_dict())]):
+                # Devolver la habitación que se apartó arriba
+                if not cls._is_dated(new_res.to_dict()):
+                    Hotel.cancel_reservation(hotel_id)
+                print("Fallo en la reservación: no se pudo guardar.")
+                return False
+            if stay:
+                Hotel.calendar(hotel_id).add(*stay)
         print(f"Reservación {reservation_id} creada exitosamente.")
+        return True
+
+    @classmethod
+    def create_reservations(cls, reservations):
+        """
+        Crea reservaciones en lote. Valida clientes, hoteles, inventario y
+        calendarios contra índices en memoria y persiste hoteles y
+        reservaciones una sola vez.
+        Devuelve {"ok": [...], "failed": [(pos, id, motivo)]}.
+        """
+        failed, accepted = [], {}
+        with FileManager.transaction():
+            customers = {c['customer_id']
+                         for c in FileManager.load_data(Customer.FILE)}
+            hotels = {h['hotel_id']: h
+                      for h in FileManager.load_data(Hotel.FILE)}
+            existing = {r['reservation_id']
+                        for r in FileManager.load_data(cls.FILE)}
+            touched = {}
+            for index, item in enumerate(reservations):
+                key = item.get('reservation_id') \
+                    if isinstance(item, dict) else None
+                try:
+                    record = cls(**item).to_dict()
+                except TypeError:
+                    failed.append((index, key, "registro inválido"))
+                    continue
+                hotel = hotels.get(record['hotel_id'])
+                reason = None
+                if key in existing or key in accepted:
+                    reason = "ID duplicado"
+                elif record['customer_id'] not in customers:
+                    reason = "cliente no encontrado"
+                elif hotel is None:
+                    reason = "hotel no encontrado"
+                elif cls._is_dated(record):
+                    # Se aparta ya para validar las siguientes del lote
+                    reason, stay = cls._check_stay(hotel, record)
+                    if stay:
+                        Hotel.calendar(record['hotel_id']).add(*stay)
+                elif hotel['rooms'] <= 0:
+                    reason = "sin habitaciones"
+                else:
+                    hotel['rooms'] -= 1
+                    touched[record['hotel_id']] = hotel
+                if reason:
+                    failed.append((index, key, reason))
+                    continue
+                accepted[key] = (index, record)
+            if not _write_batch(
+                    cls.FILE,
+                    [(key, record) for key, (_, record) in accepted.items()],
+                    [(key, None) for key in accepted], touched):
+                # Los calendarios ya incluyen estancias que no se guardaron
+                for _, record in accepted.values():
+                    CALENDARS.discard(record['hotel_id'])
+                _mark_unsaved(accepted, failed)
+        return _batch_report("reservaciones", list(accepted), failed)
+
+    @classmethod
+    def cancel_reservations(cls, reservation_ids):
+        """
+        Cancela reservaciones en lote, libera sus habitaciones y
+        persiste una sola vez. Los IDs inexistentes se reportan.
+        """
+        failed, removed = [], {}
+        with FileManager.transaction():
+            reservations = {r['reservation_id']: r
+                            for r in FileManager.load_data(cls.FILE)}
+            hotels = {h['hotel_id']: h
+                      for h in FileManager.load_data(Hotel.FILE)}
+            touched = {}
+            for index, key in enumerate(reservation_ids):
+                res = reservations.pop(key, None)
+                if res is None:
+                    failed.append((index, key, "reservación no encontrada"))
+                    continue
+                hotel = hotels.get(res['hotel_id'])
+                if cls._is_dated(res):
+                    # Cargar el calendario antes de borrar, con la estancia
+                    Hotel.calendar(res['hotel_id'])
+                elif hotel is not None:
+                    hotel['rooms'] += 1
+                    touched[res['hotel_id']] = hotel
+                removed[key] = (index, res)
+            if not _write_batch(
+                    cls.FILE, [(key, None) for key in removed],
+                    [(key, res) for key, (_, res) in removed.items()],
+                    touched):
+                _mark_unsaved(removed, failed)
+            # Solo lo que se borró libera noches en el calendario
+            for _, res in removed.values():
+                if cls._is_dated(res):
+                    Hotel.calendar(res['hotel_id']).remove(
+                        *parse_stay(res['check_in'], res['check_out']))
+        return _batch_report("cancelaciones", list(removed), failed)
+
+    @classmethod
+    def list_by_hotel(cls, hotel_id):
+        """Devuelve las reservaciones de un hotel."""
+        return FileManager.find(cls.FILE, 'hotel_id', hotel_id)
+
+    @classmethod
+    def list_by_customer(cls, customer_id):
+        """Devuelve las reservaciones de un cliente."""
+        return FileManager.find(cls.FILE, 'customer_id', customer_id)
 
     @classmethod
     def cancel_reservation(cls, reservation_id):
         """Cancela una reservación y libera la habitación."""
-        reservations = FileManager.load_data(cls.FILE)
-        res = next(
-            (r for r in reservations if r['reservation_id'] == reservation_id),
-            None
-        )
-        if not res:
-            print(f"Error: Reservación {reservation_id} no encontrada.")
-            return
-
-        # Liberar la habitación en el hotel
-        Hotel.cancel_reservation(res['hotel_id'])
-
-        # Eliminar reservación
-        new_list = [
-            r for r in reservations
-            if r['reservation_id'] != reservation_id
-        ]
-        FileManager.save_data(cls.FILE, new_list)
+        with FileManager.transaction():
+            res = FileManager.get(cls.FILE, reservation_id)
+            if not res:
+                print(f"Error: Reservación {reservation_id} no encontrada.")
+                return False
+
+            # El calendario se carga antes de borrar: si se construyera
+            # después ya no tendría la estancia y se restaría dos veces
+            calendar = Hotel.calendar(res['hotel_id']) \
+                if cls._is_dated(res) else None
+
+            # Eliminar reservación; solo si se guardó se libera el cuarto
+            if not FileManager.write(cls.FILE, [(reservation_id, None)]):
+                return False
+
+            # Liberar la habitación en el hotel o en su calendario
+            if calendar is not None:
+                calendar.remove(
+                    *parse_stay(res['check_in'], res['check_out']))
+            else:
+                Hotel.cancel_reservation(res['hotel_id'])
         print(f"Reservación {reservation_id} cancelada.")
+        return True
@@ -0,0 +1,134 @@
+"""
+Programa: load_test.py
+Descripción: Prueba de carga de reservaciones concurrentes. Lanza miles
+de reservaciones desde hilos y desde procesos contra un mismo hotel y
+verifica que no haya sobreventa ni escrituras perdidas.
+Uso: python load_test.py [--backend json|log|sqlite] [--bookings N]
+                         [--rooms N] [--workers N] [--customers N]
+"""
+import argparse
+import contextlib
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from hotel_system import (
+    Customer, FileManager, Hotel, Reservation, make_backend
+)
+
+# Motores con archivos compartidos entre procesos ('memory' no aplica)
+BACKENDS = ('json', 'log', 'sqlite')
+
+
+def setup_data(rooms, customers):
+    """Crea el hotel y los clientes de la prueba."""
+    for name in ('hotels.json', 'customers.json', 'reservations.json'):
+        FileManager.save_data(name, [])
+    Hotel.create_hotel("H1", "Carga", "CDMX", rooms)
+    for i in range(customers):
+        Customer.create_customer(f"C{i}", f"Cliente {i}", f"c{i}@mail.com")
+
+
+def init_worker(backend_name, base_dir):
+    """Cada proceso abre su propio motor sobre el directorio compartido."""
+    sys.stdout = open(  # pylint: disable=R1732
+        os.devnull, 'w', encoding='utf-8')
+    FileManager.set_backend(make_backend(backend_name, base_dir))
+
+
+def book_range(prefix, start, stop, customers):
+    """Reserva en el proceso actual; devuelve el número de éxitos."""
+    ok = 0
+    for i in range(start, stop):
+        if Reservation.create_reservation(
+                f"{prefix}{i}", f"C{i % customers}", "H1"):
+            ok += 1
+    return ok
+
+
+def make_pool(mode, backend_name, base_dir, workers):
+    """Crea el ejecutor de hilos o de procesos de la ronda."""
+    if mode == 'threads':
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_worker, initargs=(backend_name, base_dir))
+
+
+def book_all(pool, args):
+    """Reparte las reservaciones entre los workers; devuelve los éxitos."""
+    chunk = -(-args.bookings // args.workers)
+    futures = [
+        pool.submit(book_range, "R", start,
+                    min(start + chunk, args.bookings), args.customers)
+        for start in range(0, args.bookings, chunk)
+    ]
+    return sum(f.result() for f in futures)
+
+
+def read_outcome(backend_name, base_dir):
+    """Relee con un motor nuevo lo que escribieron los demás procesos."""
+    backend = make_backend(backend_name, base_dir)
+    previous = FileManager.set_backend(backend)
+    hotel = Hotel.display_hotel_info("H1")
+    reservations = len(FileManager.load_data('reservations.json'))
+    FileManager.set_backend(previous)
+    backend.close()
+    return hotel['rooms'], reservations
+
+
+def run(mode, backend_name, args):
+    """
+    Ejecuta una ronda con hilos o procesos y valida el resultado.
+    `args` trae bookings, rooms, workers y customers.
+    """
+    with tempfile.TemporaryDirectory() as base_dir, \
+            open(os.devnull, 'w', encoding='utf-8') as devnull, \
+            contextlib.redirect_stdout(devnull):
+        backend = make_backend(backend_name, base_dir)
+        previous = FileManager.set_backend(backend)
+        setup_data(args.rooms, args.customers)
+        start_time = time.perf_counter()
+        with make_pool(mode, backend_name, base_dir, args.workers) as pool:
+            successes = book_all(pool, args)
+        elapsed = time.perf_counter() - start_time
+        FileManager.set_backend(previous)
+        backend.close()
+        free, reservations = read_outcome(backend_name, base_dir)
+
+    expected = min(args.bookings, args.rooms)
+    valid = (successes == expected == reservations
+             and free == args.rooms - expected)
+    print(f"{backend_name}\t{mode}\t{args.workers}\t{args.bookings}\t"
+          f"{successes}\t{reservations}\t{free}\t"
+          f"{args.bookings / elapsed:.1f}\t"
+          f"{'OK' if valid else 'SOBREVENTA/PÉRDIDA'}")
+    return valid
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[2])
+    parser.add_argument('--backend', choices=BACKENDS,
+                        action='append')
+    parser.add_argument('--bookings', type=int, default=2000)
+    parser.add_argument('--rooms', type=int, default=1500)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--customers', type=int, default=50)
+    args = parser.parse_args()
+
+    print("BACKEND\tMODO\tWORKERS\tINTENTOS\tÉXITOS\tRESERVAS\t"
+          "LIBRES\tRESERVAS/S\tESTADO")
+    all_valid = True
+    for backend_name in args.backend or BACKENDS:
+        for mode in ('threads', 'processes'):
+            all_valid &= run(mode, backend_name, args)
+    sys.exit(0 if all_valid else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,61 @@
 import unittest
 import os
+import io
 import json
+import marshal
+import asyncio
+import tempfile
+import time
+import threading
+import contextlib
+import random
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
 from hotel_system import Hotel, Customer, Reservation, FileManager
+from hotel_storage import JsonBackend, LogBackend, MemoryBackend, \
+    SqliteBackend
+from hotel_service import HotelService
+from hotel_calendar import OccupancyCalendar
 
-class TestHotelSystem(unittest.TestCase):
+# Registros por entidad de las pruebas de volumen y su tiempo máximo (s)
+VOLUME = int(os.environ.get('HOTEL_TEST_VOLUME', 2000))
+VOLUME_BUDGET = float(os.environ.get('HOTEL_TEST_BUDGET', 60))
+
+
+class BackendTestCase(unittest.TestCase):
     """
-    Suite de Pruebas Completa: Escenarios Positivos y Negativos.
+    Base de las pruebas que usan FileManager. Cada prueba usa su propio
+    motor (en memoria salvo que la subclase cambie make_backend): no toca
+    archivos reales y puede correr en paralelo con las demás.
     """
 
+    def make_backend(self):
+        """Motor de almacenamiento de la prueba (en memoria por defecto)."""
+        return MemoryBackend()
+
     def setUp(self):
-        """Restablece los archivos JSON a un estado limpio antes de CADA prueba."""
-        self.hotels_file = FileManager.get_filepath('hotels.json')
-        self.customers_file = FileManager.get_filepath('customers.json')
-        self.reservations_file = FileManager.get_filepath('reservations.json')
+        """Instala un motor limpio antes de CADA prueba."""
+        backend = self.make_backend()
+        previous = FileManager.set_backend(backend)
+        self.addCleanup(backend.close)
+        self.addCleanup(FileManager.set_backend, previous)
+
+    def make_tmp_dir(self):
+        """Directorio temporal que se borra al terminar la prueba."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        return tmp.name
 
-        with open(self.hotels_file, 'w') as f: json.dump([], f)
-        with open(self.customers_file, 'w') as f: json.dump([], f)
-        with open(self.reservations_file, 'w') as f: json.dump([], f)
+
+class TestHotelSystem(BackendTestCase):
+    """Suite de Pruebas Completa: Escenarios Positivos y Negativos."""
+
+    def make_peer(self):
+        """
+        Otra instancia sobre los mismos datos, como la de otro proceso.
+        Si el motor no se comparte, la prueba se omite.
+        """
+        raise unittest.SkipTest("el motor no se comparte entre procesos")
 
     # ==========================================
     # CASOS POSITIVOS (Camino Feliz)
@@ -116,5 +155,696 @@ class TestHotelSystem(unittest.TestCase):
         reservations = FileManager.load_data('reservations.json')
         self.assertEqual(len(reservations), 1)
 
+    def test_modify_unknown_field(self):
+        """Negativo: Modificar un campo que la entidad no tiene."""
+        Hotel.create_hotel("H1", "Plaza", "CDMX", 10)
+        self.assertFalse(Hotel.modify_hotel_info("H1", stars=5))
+        self.assertNotIn('stars', Hotel.display_hotel_info("H1"))
+
+    # ==========================================
+    # CONSULTAS
+    # ==========================================
+
+    def test_list_reservations_by_hotel_and_customer(self):
+        """Consulta: Reservaciones filtradas por hotel y por cliente."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 5)
+        Hotel.create_hotel("H2", "Plaza", "CDMX", 5)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        Customer.create_customer("C2", "Luis", "luis@mail.com")
+        Reservation.create_reservation("R1", "C1", "H1")
+        Reservation.create_reservation("R2", "C2", "H1")
+        Reservation.create_reservation("R3", "C1", "H2")
+
+        by_hotel = Reservation.list_by_hotel("H1")
+        self.assertEqual([r['reservation_id'] for r in by_hotel], ["R1", "R2"])
+        by_customer = Reservation.list_by_customer("C1")
+        self.assertEqual(
+            [r['reservation_id'] for r in by_customer], ["R1", "R3"])
+
+    # ==========================================
+    # OPERACIONES EN LOTE
+    # ==========================================
+
+    def test_batch_create_reports_failures(self):
+        """Lote: Se crean los válidos y se reportan duplicados e inválidos."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 5)
+        report = Hotel.create_hotels([
+            {"hotel_id": "H2", "name": "Plaza", "location": "CDMX",
+             "rooms": 2},
+            {"hotel_id": "H1", "name": "Dup", "location": "USA", "rooms": 1},
+            {"hotel_id": "H3", "name": "Sin cuartos"},
+            {"hotel_id": "H2", "name": "Dup", "location": "USA", "rooms": 1},
+        ])
+        self.assertEqual(report["ok"], ["H2"])
+        self.assertEqual([f[0] for f in report["failed"]], [1, 2, 3])
+        self.assertEqual(len(FileManager.load_data('hotels.json')), 2)
+
+        report = Customer.create_customers([
+            {"customer_id": f"C{i}", "name": "N", "email": "e@mail.com"}
+            for i in range(100)
+        ])
+        self.assertEqual(len(report["ok"]), 100)
+        self.assertEqual(len(FileManager.load_data('customers.json')), 100)
+
+    def test_batch_reservations_and_cancellations(self):
+        """Lote: Reservas validadas contra inventario y cancelación masiva."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 2)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        report = Reservation.create_reservations([
+            {"reservation_id": "R1", "customer_id": "C1", "hotel_id": "H1"},
+            {"reservation_id": "R2", "customer_id": "C-GHOST",
+             "hotel_id": "H1"},
+            {"reservation_id": "R3", "customer_id": "C1", "hotel_id": "H1"},
+            {"reservation_id": "R4", "customer_id": "C1", "hotel_id": "H1"},
+            {"reservation_id": "R5", "customer_id": "C1",
+             "hotel_id": "H-GHOST"},
+        ])
+        self.assertEqual(report["ok"], ["R1", "R3"])
+        self.assertEqual([f[1] for f in report["failed"]], ["R2", "R4", "R5"])
+        self.assertEqual(Hotel.display_hotel_info("H1")['rooms'], 0)
+
+        report = Reservation.cancel_reservations(["R1", "R-FAKE", "R3"])
+        self.assertEqual(report["ok"], ["R1", "R3"])
+        self.assertEqual(report["failed"], [(1, "R-FAKE",
+                                             "reservación no encontrada")])
+        self.assertEqual(Hotel.display_hotel_info("H1")['rooms'], 2)
+        self.assertEqual(FileManager.load_data('reservations.json'), [])
+
+    # ==========================================
+    # DISPONIBILIDAD POR FECHAS
+    # ==========================================
+
+    def test_dated_reservations_respect_capacity(self):
+        """Fechas: Una habitación no se vende dos veces la misma noche."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 1)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        self.assertTrue(Reservation.create_reservation(
+            "R1", "C1", "H1", "2026-03-01", "2026-03-05"))
+        # Se traslapa una noche
+        self.assertFalse(Reservation.create_reservation(
+            "R2", "C1", "H1", "2026-03-04", "2026-03-06"))
+        # La salida es exclusiva: se puede entrar el día que otro sale
+        self.assertTrue(Reservation.create_reservation(
+            "R3", "C1", "H1", "2026-03-05", "2026-03-07"))
+        self.assertFalse(Reservation.create_reservation(
+            "R4", "C1", "H1", "2026-03-07", "2026-03-07"))
+        self.assertEqual(Hotel.display_hotel_info("H1")['rooms'], 1)
+
+        self.assertFalse(Hotel.is_available("H1", "2026-03-02", "2026-03-03"))
+        Reservation.cancel_reservation("R1")
+        self.assertTrue(Hotel.is_available("H1", "2026-03-02", "2026-03-03"))
+
+    def test_occupancy_by_day(self):
+        """Fechas: Ocupación por noche, también para reservas en lote."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 2)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        report = Reservation.create_reservations([
+            {"reservation_id": "R1", "customer_id": "C1", "hotel_id": "H1",
+             "check_in": "2026-03-01", "check_out": "2026-03-03"},
+            {"reservation_id": "R2", "customer_id": "C1", "hotel_id": "H1",
+             "check_in": "2026-03-02", "check_out": "2026-03-04"},
+            {"reservation_id": "R3", "customer_id": "C1", "hotel_id": "H1",
+             "check_in": "2026-03-02", "check_out": "2026-03-03"},
+            {"reservation_id": "R4", "customer_id": "C1", "hotel_id": "H1",
+             "check_in": "2026-03-09", "check_out": "2026-03-01"},
+        ])
+        self.assertEqual(report["ok"], ["R1", "R2"])
+        self.assertEqual([f[2] for f in report["failed"]],
+                         ["sin disponibilidad en las fechas",
+                          "fechas inválidas"])
+        self.assertEqual(
+            Hotel.occupancy_by_day("H1", "2026-02-28", "2026-03-05"),
+            {"2026-02-28": 0, "2026-03-01": 1, "2026-03-02": 2,
+             "2026-03-03": 1, "2026-03-04": 0})
+
+    # ==========================================
+    # CONCURRENCIA
+    # ==========================================
+
+    def test_concurrent_reservations_do_not_overbook(self):
+        """Concurrencia: Reservas simultáneas no exceden el inventario."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 3)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda i: Reservation.create_reservation(f"R{i}", "C1", "H1"),
+                range(20)))
+        self.assertEqual(results.count(True), 3)
+        self.assertEqual(len(FileManager.load_data('reservations.json')), 3)
+        self.assertEqual(Hotel.display_hotel_info("H1")['rooms'], 0)
+
+    def test_concurrent_creates_keep_one(self):
+        """Concurrencia: Altas simultáneas del mismo ID guardan solo una."""
+        backend, lookup = FileManager.backend, FileManager.backend.get
+
+        def slow_get(filename, key):
+            # Abrir la ventana entre la revisión del ID y la escritura
+            record = lookup(filename, key)
+            time.sleep(0.005)
+            return record
+
+        backend.get = slow_get
+        self.addCleanup(delattr, backend, 'get')
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            hotels = list(pool.map(
+                lambda i: Hotel.create_hotel("H1", f"Hotel {i}", "USA", 1),
+                range(8)))
+            customers = list(pool.map(
+                lambda i: Customer.create_customer("C1", f"Ana {i}", "a@m"),
+                range(8)))
+        self.assertEqual(hotels.count(True), 1)
+        self.assertEqual(customers.count(True), 1)
+        self.assertEqual(Hotel.display_hotel_info("H1")['name'],
+                         f"Hotel {hotels.index(True)}")
+        self.assertEqual(Customer.display_customer_info("C1")['name'],
+                         f"Ana {customers.index(True)}")
+
+    def test_stale_version_is_rejected(self):
+        """Concurrencia: Una escritura con versión vieja se rechaza."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 5)
+        stale = FileManager.get('hotels.json', "H1")
+        self.assertTrue(Hotel.reserve_room("H1"))
+        stale['rooms'] = 0
+        self.assertFalse(
+            FileManager.write_if_version('hotels.json', "H1", stale))
+        self.assertEqual(Hotel.display_hotel_info("H1")['rooms'], 4)
+
+    def test_modify_invalidates_stale_copies(self):
+        """Concurrencia: Una copia previa a una modificación se rechaza."""
+        Hotel.create_hotel("H1", "Plaza", "CDMX", 5)
+        stale = FileManager.get('hotels.json', "H1")
+        self.assertTrue(Hotel.modify_hotel_info(
+            "H1", name="Plaza Central", rooms=10))
+        stale['rooms'] -= 1
+        self.assertFalse(
+            FileManager.write_if_version('hotels.json', "H1", stale))
+        hotel = Hotel.display_hotel_info("H1")
+        self.assertEqual((hotel['name'], hotel['rooms']),
+                         ("Plaza Central", 10))
+        # La versión solo la cambia el sistema
+        self.assertFalse(Hotel.modify_hotel_info("H1", version=0))
+
+    def test_failed_write_keeps_inventory(self):
+        """Negativo: Si la reservación no se guarda, el cuarto no se pierde."""
+        Hotel.create_hotel("H1", "Plaza", "CDMX", 2)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        self.assertTrue(Reservation.create_reservation("R1", "C1", "H1"))
+
+        backend = FileManager.backend
+        write = backend.write
+
+        def failing_write(filename, changes):
+            if filename == 'reservations.json':
+                return False
+            return write(filename, changes)
+
+        backend.write = failing_write
+        self.assertFalse(Reservation.create_reservation("R2", "C1", "H1"))
+        self.assertFalse(Reservation.cancel_reservation("R1"))
+        report = Reservation.create_reservations([
+            {"reservation_id": "R3", "customer_id": "C1", "hotel_id": "H1"}])
+        self.assertEqual(report["ok"], [])
+        self.assertEqual(report["failed"], [(0, "R3", "no se pudo guardar")])
+        self.assertEqual(Hotel.display_hotel_info("H1")['rooms'], 1)
+
+    def test_failed_write_keeps_calendar(self):
+        """Negativo: Una estancia que no se guarda no ocupa el calendario."""
+        Hotel.create_hotel("H1", "Plaza", "CDMX", 1)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        self.assertTrue(Reservation.create_reservation(
+            "R1", "C1", "H1", "2026-03-01", "2026-03-03"))
+
+        backend = FileManager.backend
+        write = backend.write
+        backend.write = lambda filename, changes: \
+            False if filename == 'reservations.json' \
+            else write(filename, changes)
+        self.assertFalse(Reservation.create_reservation(
+            "R2", "C1", "H1", "2026-03-05", "2026-03-06"))
+        report = Reservation.create_reservations([
+            {"reservation_id": "R3", "customer_id": "C1", "hotel_id": "H1",
+             "check_in": "2026-03-07", "check_out": "2026-03-08"}])
+        self.assertEqual(report["ok"], [])
+        self.assertFalse(Reservation.cancel_reservation("R1"))
+        self.assertEqual(Reservation.cancel_reservations(["R1"])["ok"], [])
+        backend.write = write
+
+        self.assertTrue(Hotel.is_available("H1", "2026-03-05", "2026-03-08"))
+        self.assertFalse(Hotel.is_available("H1", "2026-03-01", "2026-03-02"))
+
+    def test_rollback_resyncs_calendar(self):
+        """Negativo: Una transacción deshecha no deja el calendario viejo."""
+        Hotel.create_hotel("H1", "Plaza", "CDMX", 1)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        with self.assertRaises(RuntimeError):
+            with FileManager.transaction():
+                Reservation.create_reservation(
+                    "R1", "C1", "H1", "2026-03-01", "2026-03-03")
+                raise RuntimeError("falla después de reservar")
+        # SQLite deshace la reservación; los motores de archivo no
+        saved = FileManager.get('reservations.json', "R1") is not None
+        self.assertEqual(
+            Hotel.is_available("H1", "2026-03-01", "2026-03-03"), not saved)
+
+    def test_cancel_with_cold_calendar(self):
+        """Fechas: Cancelar sin calendario en caché no libera de más."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 1)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        stay = ("2026-03-01", "2026-03-03")
+        self.assertTrue(Reservation.create_reservation("R1", "C1", "H1",
+                                                       *stay))
+        self.assertTrue(Reservation.create_reservation("R2", "C1", "H1",
+                                                       "2026-03-05",
+                                                       "2026-03-06"))
+        # modify_hotel_info descarta el calendario del hotel
+        Hotel.modify_hotel_info("H1", name="Resort Spa")
+        self.assertTrue(Reservation.cancel_reservation("R1"))
+        self.assertTrue(Reservation.create_reservation("R3", "C1", "H1",
+                                                       *stay))
+        self.assertFalse(Reservation.create_reservation("R4", "C1", "H1",
+                                                        *stay))
+
+        Hotel.modify_hotel_info("H1", name="Resort")
+        self.assertEqual(Reservation.cancel_reservations(["R3"])["ok"],
+                         ["R3"])
+        self.assertTrue(Reservation.create_reservation("R5", "C1", "H1",
+                                                       *stay))
+        self.assertFalse(Reservation.create_reservation("R6", "C1", "H1",
+                                                        *stay))
+        self.assertEqual(Hotel.occupancy_by_day("H1", *stay),
+                         {"2026-03-01": 1, "2026-03-02": 1})
+
+    def test_external_booking_invalidates_calendar(self):
+        """Concurrencia: Una reserva de otro proceso llega al calendario."""
+        peer = self.make_peer()
+        self.addCleanup(peer.close)
+        Hotel.create_hotel("H1", "Plaza", "CDMX", 1)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        self.assertTrue(Hotel.is_available("H1", "2026-03-01", "2026-03-03"))
+
+        peer.write('reservations.json', [("R1", {
+            "reservation_id": "R1", "customer_id": "C1", "hotel_id": "H1",
+            "check_in": "2026-03-01", "check_out": "2026-03-03",
+            "version": 0})])
+        self.assertFalse(Hotel.is_available("H1", "2026-03-02", "2026-03-03"))
+        self.assertFalse(Reservation.create_reservation(
+            "R2", "C1", "H1", "2026-03-02", "2026-03-04"))
+
+    def test_calendar_queries_validate_input(self):
+        """Negativo: Fechas inválidas u hotel inexistente en consultas."""
+        Hotel.create_hotel("H1", "Plaza", "CDMX", 1)
+        self.assertFalse(Hotel.is_available("H1", "2026-13-01", "2026-03-03"))
+        self.assertFalse(Hotel.is_available("H1", None, "2026-03-03"))
+        self.assertFalse(Hotel.is_available("H1", "2026-03-03", "2026-03-01"))
+        self.assertIsNone(Hotel.occupancy_by_day("H1", "ayer", "2026-03-03"))
+        self.assertIsNone(
+            Hotel.occupancy_by_day("H-GHOST", "2026-03-01", "2026-03-03"))
+        # La consulta de un hotel inexistente no deja un calendario vacío
+        Hotel.create_hotel("H-GHOST", "Nuevo", "CDMX", 1)
+        Customer.create_customer("C1", "Ana", "ana@mail.com")
+        self.assertTrue(Reservation.create_reservation(
+            "R1", "C1", "H-GHOST", "2026-03-01", "2026-03-02"))
+        self.assertEqual(
+            Hotel.occupancy_by_day("H-GHOST", "2026-03-01", "2026-03-02"),
+            {"2026-03-01": 1})
+
+
+class TestHotelSystemJson(TestHotelSystem):
+    """Ejecuta la misma suite contra archivos JSON en un directorio propio."""
+
+    def make_backend(self):
+        return JsonBackend(self.make_tmp_dir())
+
+    def make_peer(self):
+        return JsonBackend(FileManager.backend.base_dir)
+
+
+class TestHotelSystemSqlite(TestHotelSystem):
+    """Ejecuta la misma suite contra el motor SQLite."""
+
+    def make_backend(self):
+        return SqliteBackend(self.make_tmp_dir())
+
+    def make_peer(self):
+        return SqliteBackend(FileManager.backend.base_dir)
+
+
+class TestHotelSystemLog(TestHotelSystem):
+    """Ejecuta la misma suite contra el motor de bitácora."""
+
+    def make_backend(self):
+        return LogBackend(self.make_tmp_dir(), compact_every=5)
+
+    def make_peer(self):
+        return LogBackend(FileManager.backend.base_dir, compact_every=5)
+
+
+class TestHotelSystemVolume(BackendTestCase):
+    """
+    Pruebas de volumen de las rutas CRUD, individuales y en lote. El
+    número de registros se ajusta con HOTEL_TEST_VOLUME y el tiempo
+    máximo por prueba con HOTEL_TEST_BUDGET.
+    """
+
+    def setUp(self):
+        super().setUp()
+        # Silencia los mensajes de éxito de cada operación
+        self.enterContext(contextlib.redirect_stdout(io.StringIO()))
+
+    @contextlib.contextmanager
+    def within_budget(self):
+        """Falla la prueba si el bloque tarda más que VOLUME_BUDGET."""
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, VOLUME_BUDGET,
+                        f"{self.id()} tardó {elapsed:.2f} s")
+
+    def test_single_record_crud(self):
+        """Volumen: Alta, consulta, cambio y baja registro por registro."""
+        with self.within_budget():
+            for i in range(VOLUME):
+                Hotel.create_hotel(f"H{i}", f"Hotel {i}", "CDMX", 2)
+                Customer.create_customer(f"C{i}", f"Cliente {i}",
+                                         f"c{i}@mail.com")
+            for i in range(VOLUME):
+                self.assertTrue(Reservation.create_reservation(
+                    f"R{i}", f"C{i}", f"H{i}"))
+                self.assertTrue(Customer.modify_customer_info(
+                    f"C{i}", email=f"nuevo{i}@mail.com"))
+            for i in range(VOLUME):
+                hotel = Hotel.display_hotel_info(f"H{i}")
+                self.assertEqual(hotel['rooms'], 1)
+                self.assertEqual(
+                    len(Reservation.list_by_customer(f"C{i}")), 1)
+            for i in range(VOLUME):
+                self.assertTrue(Reservation.cancel_reservation(f"R{i}"))
+                self.assertTrue(Customer.delete_customer(f"C{i}"))
+                self.assertTrue(Hotel.delete_hotel(f"H{i}"))
+            for name in ('hotels.json', 'customers.json',
+                         'reservations.json'):
+                self.assertEqual(FileManager.load_data(name), [])
+
+    def test_batch_crud(self):
+        """Volumen: Alta y cancelación en lote con fechas."""
+        with self.within_budget():
+            hotels = Hotel.create_hotels([
+                {"hotel_id": f"H{i}", "name": f"Hotel {i}",
+                 "location": "CDMX", "rooms": 1} for i in range(VOLUME)])
+            customers = Customer.create_customers([
+                {"customer_id": f"C{i}", "name": f"Cliente {i}",
+                 "email": f"c{i}@mail.com"} for i in range(VOLUME)])
+            self.assertEqual(len(hotels["ok"]) + len(customers["ok"]),
+                             2 * VOLUME)
+
+            # Dos noches consecutivas por hotel; la tercera se traslapa
+            stays = [("2026-03-01", "2026-03-02"),
+                     ("2026-03-02", "2026-03-03"),
+                     ("2026-03-01", "2026-03-03")]
+            report = Reservation.create_reservations([
+                {"reservation_id": f"R{i}-{n}", "customer_id": f"C{i}",
+                 "hotel_id": f"H{i}", "check_in": check_in,
+                 "check_out": check_out}
+                for i in range(VOLUME) for n, (check_in, check_out)
+                in enumerate(stays)])
+            self.assertEqual(len(report["ok"]), 2 * VOLUME)
+            self.assertEqual(len(report["failed"]), VOLUME)
+            self.assertFalse(
+                Hotel.is_available("H0", "2026-03-01", "2026-03-03"))
+
+            report = Reservation.cancel_reservations(report["ok"])
+            self.assertEqual(len(report["ok"]), 2 * VOLUME)
+            self.assertEqual(FileManager.load_data('reservations.json'), [])
+            self.assertTrue(
+                Hotel.is_available("H0", "2026-03-01", "2026-03-03"))
+
+
+class TestHotelSystemVolumeLog(TestHotelSystemVolume):
+    """Pruebas de volumen contra el motor de bitácora en disco."""
+
+    def make_backend(self):
+        return LogBackend(self.make_tmp_dir())
+
+
+class TestHotelService(BackendTestCase):
+    """Pruebas de las rutas HTTP/JSON del servicio (sin red)."""
+
+    def test_routes(self):
+        """Servicio: Altas, consultas, conflictos y cancelaciones."""
+        async def scenario():
+            service = HotelService()
+            await service.start()
+            calls = [
+                ('POST', '/hotels', {"hotel_id": "H1", "name": "Resort",
+                                     "location": "Cancun", "rooms": 1}),
+                ('POST', '/hotels', {"hotel_id": "H1", "name": "Dup",
+                                     "location": "USA", "rooms": 1}),
+                ('POST', '/customers', {"customer_id": "C1", "name": "Ana",
+                                        "email": "ana@mail.com"}),
+                ('POST', '/reservations', {"reservation_id": "R1",
+                                           "customer_id": "C1",
+                                           "hotel_id": "H1"}),
+                ('GET', '/hotels/H1', None),
+                ('GET', '/hotels/H1/reservations', None),
+                ('PATCH', '/customers/C1', {"email": "nuevo@mail.com"}),
+                ('DELETE', '/reservations/R1', None),
+                ('GET', '/hotels/H-GHOST', None),
+                ('POST', '/hotels', {"hotel_id": "H2"}),
+                ('PATCH', '/hotels/H1', {"stars": 5}),
+                ('PATCH', '/hotels/H-GHOST', {"name": "Nada"}),
+            ]
+            results = []
+            for method, path, body in calls:
+                raw = json.dumps(body).encode() if body is not None else b''
+                results.append(await service.dispatch(method, path, raw))
+            await service.stop()
+            return results
+
+        results = asyncio.run(scenario())
+        self.assertEqual([int(status) for status, _ in results],
+                         [201, 409, 201, 201, 200, 200, 200, 200, 404, 400,
+                          400, 404])
+        self.assertEqual(results[4][1]['rooms'], 0)
+        self.assertEqual(len(results[5][1]), 1)
+        self.assertEqual(results[6][1]['email'], "nuevo@mail.com")
+
+    def test_reads_leave_loop_free(self):
+        """Servicio: Una lectura bloqueada no detiene el ciclo de eventos."""
+        Hotel.create_hotel("H1", "Resort", "Cancun", 1)
+        locked, release = threading.Event(), threading.Event()
+
+        def hold_transaction():
+            with FileManager.transaction():
+                locked.set()
+                release.wait(timeout=1)
+
+        async def scenario():
+            service = HotelService()
+            await service.start()
+            holder = threading.Thread(target=hold_transaction)
+            holder.start()
+            locked.wait()
+            read = asyncio.create_task(
+                service.dispatch('GET', '/hotels/H1', b''))
+            await asyncio.sleep(0.05)
+            pending = not read.done()
+            release.set()
+            result = await read
+            holder.join()
+            await service.stop()
+            return pending, result
+
+        pending, (status, record) = asyncio.run(scenario())
+        self.assertTrue(pending)
+        self.assertEqual(int(status), 200)
+        self.assertEqual(record['name'], "Resort")
+
+
+class TestOccupancyCalendar(unittest.TestCase):
+    """Pruebas del árbol de ocupación contra un conteo directo."""
+
+    def test_growth_keeps_occupancy(self):
+        """Al crecer hacia ambos lados el árbol conserva su tamaño y datos."""
+        rng = random.Random(2)
+        calendar, nights = OccupancyCalendar(), {}
+        base = date(2026, 3, 1).toordinal()
+        for step in range(300):
+            spread = 10 + step * 5
+            first = base + rng.randint(-spread, spread)
+            start = date.fromordinal(first)
+            end = date.fromordinal(first + rng.randint(1, 20))
+            calendar.add(start, end)
+            for day in range(first, end.toordinal()):
+                nights[day] = nights.get(day, 0) + 1
+            self.assertEqual(len(calendar._max),  # pylint: disable=W0212
+                             2 * calendar.size)
+        for day, used in nights.items():
+            self.assertEqual(calendar.occupancy(date.fromordinal(day)), used)
+
+
+class TestMemoryBackend(unittest.TestCase):
+    """Pruebas del motor en memoria y de sus índices secundarios."""
+
+    def test_instances_are_isolated(self):
+        """Cada instancia tiene sus propios datos."""
+        first, second = MemoryBackend(), MemoryBackend()
+        first.write('hotels.json', [("H1", {"hotel_id": "H1"})])
+        self.assertIsNotNone(first.get('hotels.json', "H1"))
+        self.assertIsNone(second.get('hotels.json', "H1"))
+
+    def test_index_follows_writes(self):
+        """El índice por hotel se actualiza al mover y borrar reservas."""
+        backend = MemoryBackend()
+        name = 'reservations.json'
+        backend.write(name, [
+            ("R1", {"reservation_id": "R1", "hotel_id": "H1"}),
+            ("R2", {"reservation_id": "R2", "hotel_id": "H1"}),
+        ])
+        self.assertEqual(len(backend.find(name, 'hotel_id', "H1")), 2)
+        backend.write(name, [
+            ("R1", {"reservation_id": "R1", "hotel_id": "H2"}),
+            ("R2", None),
+            ("R3", {"reservation_id": "R3", "hotel_id": "H2"}),
+        ])
+        self.assertEqual(backend.find(name, 'hotel_id', "H1"), [])
+        self.assertEqual(
+            [r['reservation_id']
+             for r in backend.find(name, 'hotel_id', "H2")],
+            ["R1", "R3"])
+        backend.save_data(name, [{"reservation_id": "R9", "hotel_id": "H1"}])
+        self.assertEqual(len(backend.find(name, 'hotel_id', "H1")), 1)
+        self.assertEqual(backend.find(name, 'hotel_id', "H2"), [])
+
+
+class TestLogBackend(unittest.TestCase):
+    """
+    Pruebas del motor de bitácora: reproducción, compactación,
+    recuperación ante escrituras truncadas e importación/exportación.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_replay_after_restart(self):
+        """Los cambios de la bitácora sobreviven a un reinicio."""
+        backend = LogBackend(self.base_dir)
+        backend.write('hotels.json', [("H1", {"hotel_id": "H1", "rooms": 5})])
+        backend.write('hotels.json', [("H2", {"hotel_id": "H2", "rooms": 1})])
+        backend.write('hotels.json', [("H1", None)])
+        backend.close()
+
+        reopened = LogBackend(self.base_dir)
+        self.assertIsNone(reopened.get('hotels.json', "H1"))
+        self.assertEqual(reopened.get('hotels.json', "H2")['rooms'], 1)
+        reopened.close()
+
+    def test_compaction_writes_snapshot(self):
+        """Al compactar se genera la instantánea y se vacía la bitácora."""
+        backend = LogBackend(self.base_dir, compact_every=2)
+        backend.write('customers.json', [("C1", {"customer_id": "C1"})])
+        backend.write('customers.json', [("C2", {"customer_id": "C2"})])
+        backend.close()
+        self.assertEqual(
+            os.path.getsize(os.path.join(self.base_dir, 'customers.wal')), 0)
+
+        reopened = LogBackend(self.base_dir)
+        self.assertEqual(len(reopened.load_data('customers.json')), 2)
+        reopened.close()
+
+    def test_truncated_tail_is_discarded(self):
+        """Una última línea incompleta no impide recuperar el resto."""
+        backend = LogBackend(self.base_dir)
+        backend.write('hotels.json', [("H1", {"hotel_id": "H1", "rooms": 5})])
+        backend.close()
+        with open(os.path.join(self.base_dir, 'hotels.wal'), 'a',
+                  encoding='utf-8') as f:
+            f.write('["H2",{"hotel_id":')
+
+        reopened = LogBackend(self.base_dir)
+        self.assertEqual(len(reopened.load_data('hotels.json')), 1)
+        reopened.write('hotels.json', [("H3", {"hotel_id": "H3", "rooms": 2})])
+        reopened.close()
+        self.assertEqual(
+            len(LogBackend(self.base_dir).load_data('hotels.json')), 2)
+
+    def test_binary_snapshot_round_trip(self):
+        """La instantánea binaria conserva los registros al reabrir."""
+        backend = LogBackend(self.base_dir, binary=True)
+        backend.save_data('reservations.json', [
+            {"reservation_id": "R1", "customer_id": "C1", "hotel_id": "H1",
+             "check_in": "2026-03-01", "check_out": "2026-03-02"}])
+        backend.write('reservations.json', [("R2", {
+            "reservation_id": "R2", "customer_id": "C2", "hotel_id": "H1"})])
+        backend.close()
+        self.assertTrue(os.path.exists(
+            os.path.join(self.base_dir, 'reservations.snapshot.bin')))
+
+        reopened = LogBackend(self.base_dir, binary=True)
+        self.assertEqual(
+            reopened.get('reservations.json', "R1")['check_in'], "2026-03-01")
+        self.assertEqual(
+            len(reopened.find('reservations.json', 'hotel_id', "H1")), 2)
+        reopened.close()
+
+    def test_binary_snapshot_rejects_foreign_data(self):
+        """Una instantánea binaria con algo más que valores se rechaza."""
+        path = os.path.join(self.base_dir, 'hotels.snapshot.bin')
+        for payload in (compile("print('x')", "snapshot", "exec"),
+                        (("hotel_id",), [("H1", ["lista"])]),
+                        {"fields": ("hotel_id",)}):
+            with open(path, 'wb') as f:
+                marshal.dump(payload, f)
+            with self.assertRaises(ValueError):
+                LogBackend(self.base_dir, binary=True).load_data('hotels.json')
+
+    def test_import_and_export_json(self):
+        """Los archivos JSON tradicionales se importan y exportan."""
+        with open(os.path.join(self.base_dir, 'hotels.json'), 'w',
+                  encoding='utf-8') as f:
+            json.dump([{"hotel_id": "H1", "rooms": 3}], f)
+        backend = LogBackend(self.base_dir)
+        self.assertEqual(backend.get('hotels.json', "H1")['rooms'], 3)
+
+        backend.write('hotels.json', [("H2", {"hotel_id": "H2", "rooms": 4})])
+        export_path = os.path.join(self.base_dir, 'export.json')
+        backend.export_json('hotels.json', export_path)
+        backend.close()
+        with open(export_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)), 2)
+
+    def test_legacy_json_survives_restart(self):
+        """Lo importado del JSON tradicional sobrevive a un reinicio."""
+        with open(os.path.join(self.base_dir, 'hotels.json'), 'w',
+                  encoding='utf-8') as f:
+            json.dump([{"hotel_id": "H1", "rooms": 3}], f)
+        backend = LogBackend(self.base_dir)
+        backend.write('hotels.json', [("H2", {"hotel_id": "H2", "rooms": 4})])
+        backend.close()
+        self.assertTrue(os.path.exists(
+            os.path.join(self.base_dir, 'hotels.snapshot.json')))
+
+        reopened = LogBackend(self.base_dir)
+        self.assertEqual(
+            sorted(h['hotel_id'] for h in reopened.load_data('hotels.json')),
+            ["H1", "H2"])
+        reopened.close()
+
+    def test_legacy_json_under_existing_log(self):
+        """Una bitácora sin instantánea se aplica sobre el JSON tradicional."""
+        with open(os.path.join(self.base_dir, 'hotels.json'), 'w',
+                  encoding='utf-8') as f:
+            json.dump([{"hotel_id": "H1", "rooms": 3}], f)
+        with open(os.path.join(self.base_dir, 'hotels.wal'), 'w',
+                  encoding='utf-8') as f:
+            f.write('["H2",{"hotel_id":"H2","rooms":4}]\n')
+        backend = LogBackend(self.base_dir)
+        self.assertEqual(len(backend.load_data('hotels.json')), 2)
+        backend.close()
+
+
 if __name__ == '__main__':
     unittest.main(argv=['first-arg-is-ignored'], exit=False)